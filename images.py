@@ -7,23 +7,79 @@ for offline/dev mode.
 
 import os
 import io
+import asyncio
+import hashlib
 import random
+import tempfile
+import threading
 import requests
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from PIL import Image
+from requests.adapters import HTTPAdapter
 from typing import Optional, Tuple
+from urllib3.util.retry import Retry
 
 
 # TheCatAPI endpoint
 CAT_API_URL = "https://api.thecatapi.com/v1/images/search"
 
+# HTTP timeout (seconds) for API and image download requests
+HTTP_TIMEOUT = 10
+
+# Shared HTTP session (created on first use) so TheCatAPI and the image CDN
+# reuse pooled keep-alive connections instead of a fresh TLS handshake per call
+_http_session: Optional[requests.Session] = None
+
+# image.info key under which encoded bytes are cached (formatted with the format name)
+ENCODED_BYTES_KEY = "_encoded_{}"
+
+# Round images are downscaled to this longest side and re-encoded at this
+# JPEG quality once at fetch time; every viewer and LLM call reuses the result
+ROUND_IMAGE_MAX_SIDE = 512
+ROUND_JPEG_QUALITY = 80
+
+# Background color used when flattening transparent images
+TRANSPARENT_BACKGROUND = (255, 255, 255)
+
+# Number of downloaded images (raw bytes) kept in memory, keyed by URL
+IMAGE_CACHE_SIZE = 128
+
 # Local fallback directory
 LOCAL_CATS_DIR = Path(__file__).parent / "static" / "cats"
+LOCAL_CAT_EXTENSIONS = (".jpg", ".jpeg", ".png")
+
+# Round images written to disk so the UI can serve one static file to every
+# player instead of re-encoding the PIL image per client (see save_round_image)
+ROUND_IMAGES_DIR = Path(tempfile.gettempdir()) / "cat-caption-cage-match" / "rounds"
+
+# Most round images kept on disk; the least recently used are deleted as new
+# ones are written. A live session shows at most its current image and has
+# one prefetched, so this stays well above what is in use at once.
+ROUND_IMAGES_MAX_FILES = int(os.environ.get("ROUND_IMAGES_MAX_FILES", "1024"))
+_round_image_files: Optional[OrderedDict[Path, None]] = None  # LRU order, loaded on first write
+_round_image_files_lock = threading.Lock()
+
+# Cached listing of LOCAL_CATS_DIR (refreshed when the directory mtime changes)
+_local_cats_cache: list[Path] = []
+_local_cats_mtime: Optional[float] = None
 
 # Cache for the last fetched image (to avoid re-fetching)
 _last_image: Optional[Image.Image] = None
 _last_image_url: Optional[str] = None
 
+# Per-thread random generators (request threads and prefetch workers each get their own)
+_thread_local = threading.local()
+
+
+def _rng() -> random.Random:
+    """Get this thread's random generator."""
+    rng = getattr(_thread_local, "rng", None)
+    if rng is None:
+        rng = _thread_local.rng = random.Random()
+    return rng
+
 
 def fetch_random_cat() -> Tuple[Image.Image, str]:
     """
@@ -32,10 +88,31 @@ def fetch_random_cat() -> Tuple[Image.Image, str]:
     Returns:
         Tuple of (PIL.Image, image_url)
     
-    First tries TheCatAPI, falls back to local images if API fails.
+    Fetches synchronously; main.py prefetches each session's next round
+    image in the background with this.
     """
     global _last_image, _last_image_url
     
+    image, url = _fetch_random_cat_impl()
+    
+    _last_image = image
+    _last_image_url = url
+    
+    return image, url
+
+
+async def fetch_random_cat_async() -> Tuple[Image.Image, str]:
+    """
+    Async version of fetch_random_cat for use from event-loop handlers.
+    
+    Runs the fetch (and image decode) in a worker thread so the download
+    reuses the pooled HTTP session without blocking the event loop.
+    """
+    return await asyncio.to_thread(fetch_random_cat)
+
+
+def _fetch_random_cat_impl() -> Tuple[Image.Image, str]:
+    """Fetch a cat image: TheCatAPI first, then local images, then a placeholder."""
     # Try TheCatAPI first
     image, url = _fetch_from_api()
     
@@ -47,17 +124,65 @@ def fetch_random_cat() -> Tuple[Image.Image, str]:
         # Ultimate fallback: generate a placeholder
         image, url = _generate_placeholder()
     
-    _last_image = image
-    _last_image_url = url
+    image = _shrink_for_round(image)
+    
+    # A small JPEG keeps its original bytes as its encoding and is never
+    # decoded: the UI and LLM get those bytes, and the size comes from the
+    # header. Anything else is decoded now (Image.open is lazy) so the
+    # re-encode later doesn't happen on the request path.
+    if ENCODED_BYTES_KEY.format("JPEG") not in image.info:
+        image.load()
     
     return image, url
 
 
+def _shrink_for_round(image: Image.Image) -> Image.Image:
+    """Downscale a large image in place and cache its compact JPEG encoding."""
+    if max(image.size) <= ROUND_IMAGE_MAX_SIDE:
+        return image
+    
+    image.thumbnail((ROUND_IMAGE_MAX_SIDE, ROUND_IMAGE_MAX_SIDE), Image.Resampling.LANCZOS)
+    
+    # Drop encodings of the full-size image
+    encoded_prefix = ENCODED_BYTES_KEY.format("")
+    for key in [k for k in image.info if k.startswith(encoded_prefix)]:
+        del image.info[key]
+    
+    if image.mode in ("RGB", "L"):
+        buf = io.BytesIO()
+        image.save(buf, format="JPEG", quality=ROUND_JPEG_QUALITY)
+        image.info[ENCODED_BYTES_KEY.format("JPEG")] = buf.getvalue()
+    return image
+
+
+def _get_http_session() -> requests.Session:
+    """Get or create the shared HTTP session (keep-alive + retries)."""
+    global _http_session
+    if _http_session is None:
+        session = requests.Session()
+        retries = Retry(
+            total=2,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=["GET"]
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        
+        session.headers["User-Agent"] = "CatCaptionCageMatch/1.0"
+        api_key = os.environ.get("THECATAPI_KEY", "")
+        if api_key:
+            session.headers["x-api-key"] = api_key
+        
+        _http_session = session
+    return _http_session
+
+
 def _fetch_from_api() -> Tuple[Optional[Image.Image], Optional[str]]:
     """Fetch a cat image from TheCatAPI."""
     try:
-        api_key = os.environ.get("THECATAPI_KEY", "")
-        headers = {"x-api-key": api_key} if api_key else {}
+        session = _get_http_session()
         
         params = {
             "size": "med",
@@ -65,11 +190,10 @@ def _fetch_from_api() -> Tuple[Optional[Image.Image], Optional[str]]:
             "limit": 1
         }
         
-        response = requests.get(
+        response = session.get(
             CAT_API_URL,
-            headers=headers,
             params=params,
-            timeout=10
+            timeout=HTTP_TIMEOUT
         )
         response.raise_for_status()
         
@@ -79,15 +203,8 @@ def _fetch_from_api() -> Tuple[Optional[Image.Image], Optional[str]]:
         
         image_url = data[0]["url"]
         
-        # Download the image
-        img_response = requests.get(image_url, timeout=10)
-        img_response.raise_for_status()
-        
-        image = Image.open(io.BytesIO(img_response.content))
-        
-        # Convert to RGB if necessary (some PNGs have alpha channel)
-        if image.mode in ('RGBA', 'P'):
-            image = image.convert('RGB')
+        # Download the image (cached - TheCatAPI pool is finite, URLs recur)
+        image = _open_image_bytes(_download_image_bytes(image_url))
         
         return image, image_url
         
@@ -96,26 +213,78 @@ def _fetch_from_api() -> Tuple[Optional[Image.Image], Optional[str]]:
         return None, None
 
 
+@lru_cache(maxsize=IMAGE_CACHE_SIZE)
+def _download_image_bytes(image_url: str) -> bytes:
+    """Download raw image bytes. Failed downloads raise and are not cached."""
+    response = _get_http_session().get(image_url, timeout=HTTP_TIMEOUT)
+    response.raise_for_status()
+    return response.content
+
+
+def _open_image_bytes(data: bytes) -> Image.Image:
+    """
+    Open raw image bytes as an RGB-compatible PIL Image.
+    
+    If the source is already a JPEG that needs no conversion, the original
+    bytes are kept as the cached JPEG encoding so they can be sent to the
+    LLM as-is instead of being decoded and re-encoded.
+    """
+    image = Image.open(io.BytesIO(data))
+    
+    # Palette images only need a lookup pass unless they carry transparency
+    if image.mode == 'P' and "transparency" not in image.info:
+        return image.convert('RGB')
+    
+    # Flatten transparency onto a solid background in a single masked paste
+    # (convert('RGB') would just drop the alpha channel)
+    if image.mode in ('RGBA', 'LA', 'P'):
+        rgba = image.convert('RGBA')
+        flattened = Image.new('RGB', rgba.size, TRANSPARENT_BACKGROUND)
+        flattened.paste(rgba, mask=rgba.getchannel('A'))
+        return flattened
+    
+    # JPEGs already decode straight to RGB in libjpeg's color conversion stage
+    if image.format == "JPEG":
+        image.info[ENCODED_BYTES_KEY.format("JPEG")] = data
+    
+    return image
+
+
+def _list_local_cats() -> list[Path]:
+    """
+    List image files in the local cats directory.
+    
+    The listing is cached and only re-scanned when the directory's mtime
+    changes (i.e. files were added or removed).
+    """
+    global _local_cats_cache, _local_cats_mtime
+    try:
+        mtime = os.stat(LOCAL_CATS_DIR).st_mtime
+    except OSError:
+        return []
+    
+    if mtime != _local_cats_mtime:
+        with os.scandir(LOCAL_CATS_DIR) as entries:
+            _local_cats_cache = [
+                Path(entry.path) for entry in entries
+                if entry.name.lower().endswith(LOCAL_CAT_EXTENSIONS) and entry.is_file()
+            ]
+        _local_cats_mtime = mtime
+    
+    return _local_cats_cache
+
+
 def _fetch_from_local() -> Tuple[Optional[Image.Image], Optional[str]]:
     """Fetch a random cat image from local directory."""
     try:
-        if not LOCAL_CATS_DIR.exists():
-            return None, None
-        
-        # Find all image files
-        image_files = list(LOCAL_CATS_DIR.glob("*.jpg")) + \
-                      list(LOCAL_CATS_DIR.glob("*.jpeg")) + \
-                      list(LOCAL_CATS_DIR.glob("*.png"))
+        image_files = _list_local_cats()
         
         if not image_files:
             return None, None
         
         # Pick a random image
-        image_path = random.choice(image_files)
-        image = Image.open(image_path)
-        
-        if image.mode in ('RGBA', 'P'):
-            image = image.convert('RGB')
+        image_path = _rng().choice(image_files)
+        image = _open_image_bytes(image_path.read_bytes())
         
         return image, f"local:{image_path.name}"
         
@@ -124,22 +293,18 @@ def _fetch_from_local() -> Tuple[Optional[Image.Image], Optional[str]]:
         return None, None
 
 
-def _generate_placeholder() -> Tuple[Image.Image, str]:
-    """Generate a placeholder image when no cats are available."""
-    # Create a simple colored placeholder with text
-    from PIL import ImageDraw, ImageFont
-    
-    width, height = 400, 300
-    
-    # Random pastel color
-    r = random.randint(180, 255)
-    g = random.randint(180, 255)
-    b = random.randint(180, 255)
+# Placeholder image size
+PLACEHOLDER_SIZE = (400, 300)
+
+
+@lru_cache(maxsize=1)
+def _get_placeholder_overlay() -> Image.Image:
+    """Draw the placeholder cat face once onto a transparent layer."""
+    from PIL import ImageDraw
     
-    image = Image.new('RGB', (width, height), (r, g, b))
-    draw = ImageDraw.Draw(image)
+    overlay = Image.new('RGBA', PLACEHOLDER_SIZE, (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
     
-    # Draw a simple cat face
     # Ears
     draw.polygon([(80, 100), (120, 40), (160, 100)], fill=(100, 100, 100))
     draw.polygon([(240, 100), (280, 40), (320, 100)], fill=(100, 100, 100))
@@ -161,15 +326,87 @@ def _generate_placeholder() -> Tuple[Image.Image, str]:
         draw.line([(100, 190 + y_offset), (150, 185 + y_offset)], fill=(80, 80, 80), width=1)
         draw.line([(250, 185 + y_offset), (300, 190 + y_offset)], fill=(80, 80, 80), width=1)
     
+    return overlay
+
+
+def _generate_placeholder() -> Tuple[Image.Image, str]:
+    """Generate a placeholder image when no cats are available."""
+    # Random pastel color
+    rng = _rng()
+    r = rng.randint(180, 255)
+    g = rng.randint(180, 255)
+    b = rng.randint(180, 255)
+    
+    # Composite the pre-drawn cat face over the background in one pass
+    overlay = _get_placeholder_overlay()
+    image = Image.new('RGB', PLACEHOLDER_SIZE, (r, g, b))
+    image.paste(overlay, mask=overlay)
+    
     return image, "placeholder:generated"
 
 
 def image_to_bytes(image: Image.Image, format: str = "JPEG") -> bytes:
-    """Convert PIL Image to bytes."""
+    """
+    Convert PIL Image to bytes.
+    
+    The encoded bytes are cached in image.info, so each round's image is
+    encoded at most once per format no matter how many callers need it.
+    """
+    cache_key = ENCODED_BYTES_KEY.format(format.upper())
+    cached = image.info.get(cache_key)
+    if cached is not None:
+        return cached
+    
     buf = io.BytesIO()
     image.save(buf, format=format)
-    buf.seek(0)
-    return buf.getvalue()
+    data = buf.getvalue()
+    image.info[cache_key] = data
+    return data
+
+
+def bytes_to_image(data: bytes) -> Image.Image:
+    """Decode image bytes (e.g. from image_to_bytes) back into a PIL Image."""
+    return _open_image_bytes(data)
+
+
+def save_round_image(image: Image.Image) -> Optional[str]:
+    """
+    Write a round image's JPEG bytes under ROUND_IMAGES_DIR and return the path.
+    
+    Files are named by content hash, so the same image is only written once.
+    Returns None if the image can't be written; callers fall back to the PIL image.
+    """
+    try:
+        data = image_to_bytes(image, "JPEG")
+        path = ROUND_IMAGES_DIR / f"{hashlib.sha1(data).hexdigest()[:16]}.jpg"
+        if not path.exists():
+            ROUND_IMAGES_DIR.mkdir(parents=True, exist_ok=True)
+            # Write then rename so a reader never sees a partial file
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        _track_round_image(path)
+        return str(path)
+    except Exception as e:
+        print(f"Round image cache error: {e}")
+        return None
+
+
+def _track_round_image(path: Path) -> None:
+    """Mark a round image as just used and delete the oldest past ROUND_IMAGES_MAX_FILES."""
+    global _round_image_files
+    with _round_image_files_lock:
+        if _round_image_files is None:
+            # Pick up files left by earlier runs, oldest first
+            existing = sorted(ROUND_IMAGES_DIR.glob("*.jpg"), key=lambda p: p.stat().st_mtime)
+            _round_image_files = OrderedDict.fromkeys(existing)
+        _round_image_files[path] = None
+        _round_image_files.move_to_end(path)
+        stale = []
+        while len(_round_image_files) > ROUND_IMAGES_MAX_FILES:
+            stale.append(_round_image_files.popitem(last=False)[0])
+    for old_path in stale:
+        old_path.unlink(missing_ok=True)
 
 
 def get_last_image() -> Tuple[Optional[Image.Image], Optional[str]]:
@@ -190,6 +427,15 @@ def describe_image_for_llm(image: Image.Image) -> str:
     return f"A {aspect} cat photo ({width}x{height} pixels)"
 
 
+def has_libjpeg_turbo() -> bool:
+    """Check whether Pillow's JPEG codec is backed by libjpeg-turbo (SIMD)."""
+    try:
+        from PIL import features
+        return bool(features.check_feature("libjpeg_turbo"))
+    except Exception:
+        return False
+
+
 def ensure_local_cats_dir() -> None:
     """Ensure the local cats directory exists."""
     LOCAL_CATS_DIR.mkdir(parents=True, exist_ok=True)
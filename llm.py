@@ -6,29 +6,63 @@ Includes a fake_llm mode for testing without an API key.
 """
 
 import os
+import atexit
+import asyncio
 import json
 import random
 import hashlib
-import base64
-import io
-from typing import Optional
+import string
+import functools
+import threading
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Iterable, Iterator, Optional, TypedDict, Union
 from PIL import Image
 
-# Try to import Groq
-try:
-    from groq import Groq
-    GROQ_AVAILABLE = True
-except ImportError:
-    GROQ_AVAILABLE = False
-    Groq = None
+import images
+
+# LLM SDKs are imported lazily on first use: google.generativeai in particular
+# drags in protobuf/grpc at import time, which fake mode never needs.
+# *_AVAILABLE is None until the first import attempt.
+Groq = None
+GROQ_AVAILABLE: Optional[bool] = None
 
-# Try to import Google Generative AI
+genai = None
+GENAI_AVAILABLE: Optional[bool] = None
+
+
+def _load_groq() -> bool:
+    """Import the Groq SDK on first use. Returns True if available."""
+    global Groq, GROQ_AVAILABLE
+    if GROQ_AVAILABLE is None:
+        try:
+            from groq import Groq as _Groq
+            Groq = _Groq
+            GROQ_AVAILABLE = True
+        except ImportError:
+            GROQ_AVAILABLE = False
+    return GROQ_AVAILABLE
+
+
+def _load_genai() -> bool:
+    """Import the Google Generative AI SDK on first use. Returns True if available."""
+    global genai, GENAI_AVAILABLE
+    if GENAI_AVAILABLE is None:
+        try:
+            import google.generativeai as _genai
+            genai = _genai
+            GENAI_AVAILABLE = True
+        except ImportError:
+            GENAI_AVAILABLE = False
+    return GENAI_AVAILABLE
+
+# Try to import orjson (faster JSON parsing; stdlib json is the fallback)
 try:
-    import google.generativeai as genai
-    GENAI_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    GENAI_AVAILABLE = False
-    genai = None
+    ORJSON_AVAILABLE = False
+    orjson = None
 
 
 # Model configuration
@@ -36,11 +70,60 @@ except ImportError:
 GROQ_TEXT_MODEL = "llama-3.3-70b-versatile"
 GEMINI_MODEL = "gemini-1.5-flash"
 
+# A round's image: a PIL image, or its already-encoded JPEG bytes
+RoundImage = Union[Image.Image, bytes]
+
 # Cached instances
 _groq_client = None
 _gemini_model = None
 _configured_provider = None  # 'groq', 'gemini', or None
 
+# Stripped from both ends of a caption's normalized key
+_KEY_STRIP_CHARS = string.punctuation + " "
+
+# Captions shorter than this (after stripping) get a fixed zero score without an LLM call
+MIN_CAPTION_CHARS = 2
+TRIVIAL_CAPTION_ROAST = "Too lazy to type? I'm too lazy to score."
+
+# Scores already returned for (image key, normalized caption), LRU-evicted.
+# The image key is a hash of the image's JPEG bytes when available (see _image_cache_key)
+SCORE_CACHE_SIZE = 4096
+_score_cache: OrderedDict[tuple[str, str], dict] = OrderedDict()
+_score_cache_lock = threading.Lock()
+
+# Max captions per LLM request when scoring asynchronously. A typical round goes
+# out as one request (image and instructions sent once); larger rounds are split
+# into evenly sized batches that are scored concurrently
+LLM_BATCH_SIZE = 20
+
+# Max in-flight LLM requests across all sessions (async path) - keep under the provider's RPM limit
+LLM_MAX_CONCURRENCY = int(os.environ.get("LLM_MAX_CONCURRENCY", "16"))
+_llm_semaphore: Optional[asyncio.Semaphore] = None
+
+# Retries for rate-limited (429), overloaded (5xx) or timed-out LLM requests,
+# with exponential backoff and jitter, before falling back to fake scores
+LLM_MAX_RETRIES = 4
+LLM_RETRY_INITIAL = 0.5  # seconds before the first retry
+LLM_RETRY_MAX_DELAY = 8.0  # cap on the delay between retries
+LLM_RETRY_DEADLINE = 30.0  # total seconds to keep retrying one request
+_gemini_retry = None  # google.api_core Retry, built on first Gemini request
+
+# Idle seconds a pooled LLM connection is kept open (httpx defaults to 5) -
+# rounds are minutes apart, so the default pays a fresh TLS handshake every round
+LLM_KEEPALIVE_EXPIRY = 120.0
+
+# Worker threads for hedged (concurrent Groq + Gemini) scoring: a pair per
+# in-flight batch. The losing request can't be cancelled once running and
+# keeps its thread until it finishes (up to the retry deadline), so size for
+# every concurrent batch rather than one shared pair.
+_hedge_executor = ThreadPoolExecutor(max_workers=2 * LLM_MAX_CONCURRENCY, thread_name_prefix="llm-hedge")
+
+# Longest edge (px) of the image sent to vision models - plenty for judging captions
+LLM_IMAGE_MAX_SIDE = 512
+
+# image.info key for the cached downscaled copy
+_THUMB_KEY = "_llm_thumb"
+
 
 def configure_api() -> bool:
     """Configure the LLM API. Tries Groq first, then Gemini."""
@@ -48,26 +131,34 @@ def configure_api() -> bool:
     
     # Try Groq first
     groq_key = os.environ.get("GROQ_API_KEY", "")
-    if groq_key and GROQ_AVAILABLE:
+    if groq_key and _load_groq():
         try:
-            _groq_client = Groq(api_key=groq_key)
+            # The SDK retries 429s, 5xx and timeouts with jittered exponential backoff
+            _groq_client = Groq(
+                api_key=groq_key,
+                http_client=_make_llm_http_client(),
+                max_retries=LLM_MAX_RETRIES
+            )
             _configured_provider = 'groq'
-            return True
         except Exception as e:
             print(f"Groq configuration failed: {e}")
     
-    # Fall back to Gemini
+    # Fall back to Gemini (or configure it alongside Groq when hedging)
     gemini_key = os.environ.get("GOOGLE_API_KEY", "")
-    if gemini_key and GENAI_AVAILABLE:
+    if _configured_provider == 'groq' and not is_hedge_mode():
+        return True
+    if gemini_key and _load_genai():
         try:
             genai.configure(api_key=gemini_key)
             _gemini_model = genai.GenerativeModel(GEMINI_MODEL)
-            _configured_provider = 'gemini'
-            return True
+            if _configured_provider is None:
+                _configured_provider = 'gemini'
         except Exception as e:
             print(f"Gemini configuration failed: {e}")
+    if _configured_provider is not None:
+        return True
     
-    if not GROQ_AVAILABLE and not GENAI_AVAILABLE:
+    if not _load_groq() and not _load_genai():
         print("Warning: Neither groq nor google-generativeai packages installed")
     elif not groq_key and not gemini_key:
         print("Warning: Neither GROQ_API_KEY nor GOOGLE_API_KEY set")
@@ -75,30 +166,78 @@ def configure_api() -> bool:
     return False
 
 
+def _make_llm_http_client():
+    """
+    Create the process-wide keep-alive HTTP client for the Groq SDK.
+    
+    Sized for LLM_MAX_CONCURRENCY in-flight requests and closed at exit.
+    httpx is a dependency of the Groq SDK, so it's available whenever Groq is.
+    """
+    import httpx
+    client = httpx.Client(
+        limits=httpx.Limits(
+            max_connections=LLM_MAX_CONCURRENCY * 2,
+            max_keepalive_connections=LLM_MAX_CONCURRENCY,
+            keepalive_expiry=LLM_KEEPALIVE_EXPIRY
+        )
+    )
+    atexit.register(client.close)
+    return client
+
+
 def is_fake_mode() -> bool:
     """Check if fake LLM mode is enabled."""
     return os.environ.get("FAKE_LLM_MODE", "").lower() == "true"
 
 
-def _image_to_base64(image: Image.Image) -> str:
-    """Convert PIL Image to base64 string."""
-    buffered = io.BytesIO()
-    image.save(buffered, format="JPEG")
-    return base64.b64encode(buffered.getvalue()).decode('utf-8')
+def is_hedge_mode() -> bool:
+    """Check if hedged scoring (query Groq and Gemini concurrently) is enabled."""
+    return os.environ.get("LLM_HEDGE", "").lower() == "true"
+
+
+def _json_loads(text: str):
+    """Parse JSON with orjson when available (raises json.JSONDecodeError subclasses)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _thumb_for_llm(image: Image.Image, max_side: int = LLM_IMAGE_MAX_SIDE) -> Image.Image:
+    """
+    Get a downscaled copy of the image for vision models.
+    
+    Small images are returned as-is. The thumbnail is cached in image.info
+    so retries and fallbacks don't redo the resize (or its JPEG encode).
+    """
+    if max(image.size) <= max_side:
+        return image
+    
+    thumb = image.info.get(_THUMB_KEY)
+    if thumb is None:
+        thumb = image.copy()
+        thumb.info = {}  # Don't inherit the full-size image's cached encodings
+        thumb.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+        image.info[_THUMB_KEY] = thumb
+    return thumb
 
 
 def score_captions(
-    image: Image.Image,
+    image: Optional[RoundImage],
     captions: list[dict],
-    image_description: Optional[str] = None
+    image_description: Optional[str] = None,
+    image_url: Optional[str] = None
 ) -> list[dict]:
     """
     Score all captions for a round using the LLM.
     
     Args:
-        image: The cat image for this round
-        captions: List of {'player_name': str, 'caption': str}
+        image: The cat image for this round (PIL image or JPEG bytes), or
+            None if it is no longer available (captions are judged on text alone)
+        captions: List of {'player_name': str, 'caption': str}; other keys
+            are ignored, so storage rows can be passed as-is
         image_description: Optional description of the image
+        image_url: Source URL of the image; keys the score cache when the
+            image has no encoded bytes to hash
     
     Returns:
         List of {'player_name': str, 'caption': str, 'score': int, 'roast_comment': str}
@@ -106,42 +245,273 @@ def score_captions(
     if not captions:
         return []
     
+    # Only send unique, non-trivial, not-yet-scored captions to the LLM
+    unique_captions, caption_keys = _dedupe_captions(captions)
+    image_key = _image_cache_key(image, image_url)
+    hits, misses = _split_cached_scores(image_key, unique_captions)
+    scored_misses, cacheable = _score_unique_captions(image, misses) if misses else ([], False)
+    if cacheable:
+        _cache_scores(image_key, misses, scored_misses)
+    scored_unique = _merge_cached_scores(unique_captions, hits, misses, scored_misses)
+    
+    return _project_scores(captions, caption_keys, unique_captions, scored_unique)
+
+
+async def score_captions_async(
+    image: Optional[RoundImage],
+    captions: list[dict],
+    image_description: Optional[str] = None,
+    image_url: Optional[str] = None
+) -> list[dict]:
+    """
+    Async version of score_captions that doesn't block the event loop.
+    
+    Unique captions are scored in a single request when there are at most
+    LLM_BATCH_SIZE of them; otherwise they are split into evenly sized
+    batches that are scored concurrently (bounded by LLM_MAX_CONCURRENCY), so a large
+    round costs roughly one request's latency. Provider SDK calls run in
+    worker threads.
+    """
+    if not captions:
+        return []
+    
+    unique_captions, caption_keys = _dedupe_captions(captions)
+    image_key = _image_cache_key(image, image_url)
+    hits, misses = _split_cached_scores(image_key, unique_captions)
+    batches = _split_batches(misses, LLM_BATCH_SIZE)
+    semaphore = _get_llm_semaphore()
+    
+    async def _score_batch(batch: list[dict]) -> list[dict]:
+        async with semaphore:
+            results, cacheable = await asyncio.to_thread(_score_unique_captions, image, batch)
+        if cacheable:
+            _cache_scores(image_key, batch, results)
+        return results
+    
+    batch_results = await asyncio.gather(*(_score_batch(batch) for batch in batches))
+    scored_misses = [result for results in batch_results for result in results]
+    scored_unique = _merge_cached_scores(unique_captions, hits, misses, scored_misses)
+    
+    return _project_scores(captions, caption_keys, unique_captions, scored_unique)
+
+
+def _split_batches(captions: list[dict], max_size: int) -> list[list[dict]]:
+    """Split captions into the fewest batches of at most max_size, evenly sized."""
+    if not captions:
+        return []
+    n_batches = -(-len(captions) // max_size)
+    size = -(-len(captions) // n_batches)
+    return [captions[i:i + size] for i in range(0, len(captions), size)]
+
+
+def _get_llm_semaphore() -> asyncio.Semaphore:
+    """Get or create the semaphore bounding concurrent LLM requests."""
+    global _llm_semaphore
+    if _llm_semaphore is None:
+        _llm_semaphore = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+    return _llm_semaphore
+
+
+def _score_unique_captions(image: Optional[RoundImage], captions: list[dict]) -> tuple[list[dict], bool]:
+    """
+    Dispatch scoring to the configured provider (or fake mode).
+    
+    Returns (results, cacheable). Only real LLM scores, or fake scores in
+    FAKE_LLM_MODE, are cacheable: fake scores standing in for a failed
+    request must not be pinned to the caption once the provider recovers.
+    """
     # Use fake mode if enabled or if no API configured
     if is_fake_mode() or _configured_provider is None:
-        return _fake_score_captions(captions)
+        return _fake_score_captions(captions), is_fake_mode()
     
     try:
+        if is_hedge_mode() and _groq_client is not None and _gemini_model is not None:
+            return _hedged_score_captions(image, captions), True
         if _configured_provider == 'groq':
-            return _groq_score_captions(image, captions)
+            return _groq_score_captions(image, captions), True
         elif _configured_provider == 'gemini':
-            return _gemini_score_captions(image, captions)
-        else:
-            return _fake_score_captions(captions)
+            return _gemini_score_captions(image, captions), True
     except Exception as e:
-        print(f"LLM scoring failed: {e}")
-        # Fall back to fake scoring
-        return _fake_score_captions(captions)
+        print(f"LLM scoring failed, using fake scores for {len(captions)} caption(s): {e}")
+    # Fall back to fake scoring
+    return _fake_score_captions(captions), False
 
 
-def _build_prompt(captions: list[dict], has_image: bool = False) -> str:
-    """Build the scoring prompt."""
-    caption_list = "\n".join([
-        f"{i+1}. Player: \"{c['player_name']}\" - Caption: \"{c['caption']}\""
-        for i, c in enumerate(captions)
-    ])
+def _caption_key(caption: str) -> str:
+    """
+    Normalize a caption for duplicate detection and the score cache: case and
+    whitespace-insensitive, ignoring leading/trailing punctuation ("LOL!" == "lol").
+    Captions that are all punctuation (e.g. emoji) keep it.
+    """
+    key = " ".join(caption.casefold().split())
+    return key.strip(_KEY_STRIP_CHARS) or key
+
+
+def _image_cache_key(image: Optional[RoundImage], image_url: Optional[str]) -> Optional[str]:
+    """
+    Key an image in the score cache by a hash of its JPEG bytes, so the same
+    cat served under different URLs (or different cats under a shared
+    placeholder/local URL) is keyed correctly. Falls back to the URL for PIL
+    images without a cached encoding. None (skip the cache) without an image.
+    """
+    if image is None:
+        return None
+    data = image if isinstance(image, bytes) else image.info.get(images.ENCODED_BYTES_KEY.format("JPEG"))
+    if data:
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+    return image_url
+
+
+def _dedupe_captions(captions: list[dict]) -> tuple[list[dict], list[Optional[str]]]:
+    """
+    Collapse duplicate captions and drop trivial ones before scoring.
+    
+    Returns (unique_captions, keys) where keys[i] is the normalized key of
+    captions[i], or None if that caption is too short to be worth scoring.
+    """
+    unique = []
+    seen = set()
+    keys = []
+    for c in captions:
+        caption = c.get('caption', '')
+        if len(caption.strip()) < MIN_CAPTION_CHARS:
+            keys.append(None)
+            continue
+        key = _caption_key(caption)
+        keys.append(key)
+        if key not in seen:
+            seen.add(key)
+            unique.append(c)
+    return unique, keys
+
+
+def _split_cached_scores(
+    image_key: Optional[str],
+    unique_captions: list[dict]
+) -> tuple[dict[str, dict], list[dict]]:
+    """
+    Look up cached scores for this image (see _image_cache_key).
+    
+    Returns (hits, misses): hits maps caption key to a cached result, misses
+    are the captions that still need scoring.
+    """
+    if not image_key:
+        return {}, unique_captions
+    
+    hits = {}
+    misses = []
+    with _score_cache_lock:
+        for c in unique_captions:
+            cache_key = (image_key, _caption_key(c.get('caption', '')))
+            cached = _score_cache.get(cache_key)
+            if cached is None:
+                misses.append(c)
+            else:
+                _score_cache.move_to_end(cache_key)
+                hits[cache_key[1]] = cached
+    return hits, misses
+
+
+def _cache_scores(image_key: Optional[str], captions: list[dict], scored: list[dict]) -> None:
+    """Cache the LLM's scores for captions (unique, as sent) under this image."""
+    if not image_key:
+        return
+    keys = [_caption_key(c.get('caption', '')) for c in captions]
+    fresh = _project_scores(captions, keys, captions, scored)
+    if not fresh:
+        return
+    with _score_cache_lock:
+        for result in fresh:
+            cache_key = (image_key, _caption_key(result['caption']))
+            _score_cache[cache_key] = result
+            _score_cache.move_to_end(cache_key)
+        while len(_score_cache) > SCORE_CACHE_SIZE:
+            _score_cache.popitem(last=False)
+
+
+def _merge_cached_scores(
+    unique_captions: list[dict],
+    hits: dict[str, dict],
+    misses: list[dict],
+    scored_misses: list[dict]
+) -> list[dict]:
+    """Return results for unique_captions in order, from cache hits and fresh scores."""
+    miss_keys = [_caption_key(c.get('caption', '')) for c in misses]
+    fresh = _project_scores(misses, miss_keys, misses, scored_misses)
     
-    if has_image:
-        criteria = """Your job is to rate each caption on a scale of 0-10 based on:
+    by_key = dict(hits)
+    for result in fresh:
+        by_key[_caption_key(result['caption'])] = result
+    
+    keys = (_caption_key(c.get('caption', '')) for c in unique_captions)
+    return [by_key[key] for key in keys if key in by_key]
+
+
+def _project_scores(
+    captions: list[dict],
+    keys: list[Optional[str]],
+    unique_captions: list[dict],
+    scored_unique: list[dict]
+) -> list[dict]:
+    """Map scores for the unique captions back onto every original caption."""
+    by_key = {}
+    if len(scored_unique) == len(unique_captions):
+        # Results are requested in the same order as given
+        for c, result in zip(unique_captions, scored_unique):
+            by_key[_caption_key(c.get('caption', ''))] = result
+    for result in scored_unique:
+        by_key.setdefault(_caption_key(result.get('caption', '')), result)
+    
+    results = []
+    for c, key in zip(captions, keys):
+        if key is None:
+            score, roast_comment = 0, TRIVIAL_CAPTION_ROAST
+        elif key in by_key:
+            score, roast_comment = by_key[key]['score'], by_key[key]['roast_comment']
+        else:
+            continue  # LLM dropped this caption
+        results.append({
+            'player_name': c.get('player_name', 'Unknown'),
+            'caption': c.get('caption', ''),
+            'score': score,
+            'roast_comment': roast_comment
+        })
+    return results
+
+
+# Scoring criteria for the prompt (vision models can judge relevance to the image)
+IMAGE_CRITERIA = """Your job is to rate each caption on a scale of 0-10 based on:
 - HUMOR (0-10): How funny is it? Does it make you laugh?
 - RELEVANCE (0-10): How well does it relate to the cat image?
 
 The final score is the average of humor and relevance, rounded to the nearest integer."""
-    else:
-        criteria = """Your job is to rate each caption on a scale of 0-10 based on:
+
+TEXT_CRITERIA = """Your job is to rate each caption on a scale of 0-10 based on:
 - HUMOR (0-10): How funny is it? Does it make you laugh?
 - CREATIVITY (0-10): How clever or original is it as a cat meme caption?
 
 The final score is the average of humor and creativity, rounded to the nearest integer."""
+
+
+class _ScoredCaption(TypedDict):
+    player_name: str
+    caption: str
+    score: int
+    roast_comment: str
+
+
+class _ScoreResponse(TypedDict):
+    results: list[_ScoredCaption]
+
+
+def _build_prompt(captions: list[dict], has_image: bool = False) -> str:
+    """Build the scoring prompt."""
+    caption_list = "\n".join(
+        f"{i}. Player: \"{c['player_name']}\" - Caption: \"{c['caption']}\""
+        for i, c in enumerate(captions, 1)
+    )
+    
+    criteria = IMAGE_CRITERIA if has_image else TEXT_CRITERIA
     
     return f"""You are "Cat Meme Gordon Ramsay" - a brutally honest but hilarious judge of cat meme captions.
 
@@ -171,82 +541,297 @@ Make sure to include ALL captions in your response, in the same order as given."
 
 def _parse_llm_response(response_text: str, captions: list[dict]) -> list[dict]:
     """Parse and validate LLM response."""
-    # Clean up common JSON issues
-    response_text = response_text.strip()
-    if response_text.startswith("```json"):
-        response_text = response_text[7:]
-    if response_text.startswith("```"):
-        response_text = response_text[3:]
-    if response_text.endswith("```"):
-        response_text = response_text[:-3]
-    response_text = response_text.strip()
-    
-    data = json.loads(response_text)
+    # Clean up common JSON issues (markdown code fences)
+    response_text = (
+        response_text.strip()
+        .removeprefix("```json")
+        .removeprefix("```")
+        .removesuffix("```")
+        .strip()
+    )
+    
+    data = _json_loads(response_text)
     results = data.get("results", [])
     
     # Validate and clean up results
-    scored_results = []
-    for result in results:
-        scored_results.append({
-            'player_name': result.get('player_name', 'Unknown'),
-            'caption': result.get('caption', ''),
-            'score': max(0, min(10, int(result.get('score', 5)))),
-            'roast_comment': result.get('roast_comment', 'No comment.')
-        })
-    
-    return scored_results
+    return [_clean_result(result) for result in results]
 
 
-def _groq_score_captions(image: Image.Image, captions: list[dict]) -> list[dict]:
-    """Score captions using Groq API (text-only mode for now)."""
-    if _groq_client is None:
-        return _fake_score_captions(captions)
+def _clean_result(result: dict) -> dict:
+    """Validate and normalize a single scored caption from the LLM."""
+    score = int(result.get('score', 5))
+    return {
+        'player_name': result.get('player_name', 'Unknown'),
+        'caption': result.get('caption', ''),
+        'score': 0 if score < 0 else 10 if score > 10 else score,
+        'roast_comment': result.get('roast_comment', 'No comment.')
+    }
+
+
+def _iter_result_objects(chunks: Iterable[str]) -> Iterator[dict]:
+    """
+    Incrementally yield result objects from a streamed LLM JSON response.
+    
+    Tracks brace/bracket depth (ignoring anything inside strings) and parses
+    each object inside the top-level {"results": [...]} as soon as its
+    closing brace arrives, without waiting for the rest of the response.
+    """
+    buf = []
+    depth = 0
+    start = None
+    in_string = False
+    escaped = False
+    pos = 0
+    
+    for chunk in chunks:
+        if not chunk:
+            continue
+        buf.append(chunk)
+        for ch in chunk:
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == '\\':
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch in '{[':
+                if ch == '{' and depth == 2:
+                    start = pos
+                depth += 1
+            elif ch in '}]':
+                depth -= 1
+                if ch == '}' and depth == 2 and start is not None:
+                    text = "".join(buf)
+                    yield _json_loads(text[start:pos + 1])
+                    buf = [text]
+                    start = None
+            pos += 1
+
+
+def _parse_llm_stream(chunks: Iterable[str], captions: list[dict]) -> list[dict]:
+    """
+    Parse a streamed LLM response, consuming results as they arrive.
+    
+    Returns as soon as there is a result per caption, without waiting for
+    the rest of the stream. Falls back to parsing the full text if no result
+    objects could be extracted incrementally (e.g. unexpected response shape).
+    Raises ValueError if any caption is left without a result, so the caller
+    falls back rather than dropping those players from the round.
+    """
+    received = []
+    
+    def _tee() -> Iterator[str]:
+        for chunk in chunks:
+            received.append(chunk or "")
+            yield chunk
     
+    results = []
+    for result in _iter_result_objects(_tee()):
+        results.append(_clean_result(result))
+        if len(results) == len(captions):
+            return results
+    if not results:
+        results = _parse_llm_response("".join(received), captions)
+    _check_all_scored(results, captions)
+    return results
+
+
+def _check_all_scored(results: list[dict], captions: list[dict]) -> None:
+    """Raise ValueError unless every caption has a result (see _project_scores)."""
+    if len(results) == len(captions):
+        return
+    scored = {_caption_key(r['caption']) for r in results}
+    missing = sum(1 for c in captions if _caption_key(c.get('caption', '')) not in scored)
+    if missing:
+        raise ValueError(f"LLM response has no result for {missing} of {len(captions)} caption(s)")
+
+
+def _groq_request(image: Optional[RoundImage], captions: list[dict]) -> list[dict]:
+    """Score captions with Groq (text-only mode for now). Raises on failure."""
     prompt = _build_prompt(captions, has_image=False)
     
+    # Using text model - captions are judged on humor/creativity alone
+    stream = _groq_client.chat.completions.create(
+        model=GROQ_TEXT_MODEL,
+        messages=[
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ],
+        max_tokens=max(1024, 96 * len(captions)),  # room for a roast per caption
+        temperature=0.7,
+        stream=True
+    )
+    
     try:
-        # Using text model - captions are judged on humor/creativity alone
-        response = _groq_client.chat.completions.create(
-            model=GROQ_TEXT_MODEL,
-            messages=[
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            max_tokens=1024,
-            temperature=0.7
+        return _parse_llm_stream(
+            (chunk.choices[0].delta.content for chunk in stream if chunk.choices),
+            captions
         )
-        
-        response_text = response.choices[0].message.content
-        return _parse_llm_response(response_text, captions)
+    finally:
+        stream.close()  # Release the connection if we stopped reading early
+
+
+def _gemini_request(image: Optional[RoundImage], captions: list[dict]) -> list[dict]:
+    """Score captions with Gemini vision (text-only without an image). Raises on failure."""
+    prompt = _build_prompt(captions, has_image=image is not None)
+    
+    # Send a downscaled, pre-encoded JPEG so the SDK doesn't re-encode the
+    # full-size PIL image per call (round images arrive already encoded)
+    if image is None:
+        contents = [prompt]
+    else:
+        if isinstance(image, bytes):
+            image_bytes = image
+        else:
+            image_bytes = images.image_to_bytes(_thumb_for_llm(image), "JPEG")
+        contents = [{"mime_type": "image/jpeg", "data": image_bytes}, prompt]
+    
+    # Constrain the output to the results schema so it always parses
+    generation_config = genai.GenerationConfig(
+        response_mime_type="application/json",
+        response_schema=_ScoreResponse
+    )
+    stream = _gemini_model.generate_content(
+        contents,
+        generation_config=generation_config,
+        stream=True,
+        request_options={"retry": _get_gemini_retry()}
+    )
+    
+    try:
+        return _parse_llm_stream((chunk.text for chunk in stream), captions)
+    finally:
+        _cancel_gemini_stream(stream)  # Release the connection if we stopped reading early
+
+
+def _cancel_gemini_stream(stream) -> None:
+    """
+    Cancel the RPC behind a Gemini streaming response.
+    
+    GenerateContentResponse has no close(); its gRPC call (kept on
+    _iterator) is only cancelled when garbage collected, so cancel it here
+    instead. A no-op once the stream is exhausted or if the SDK changes shape.
+    """
+    cancel = getattr(getattr(stream, "_iterator", None), "cancel", None)
+    if cancel is not None:
+        try:
+            cancel()
+        except Exception as e:
+            print(f"Gemini stream cancel error: {e}")
+
+
+def _get_gemini_retry():
+    """
+    Get the retry policy for Gemini requests: rate limits (ResourceExhausted),
+    overload and timeouts are retried with jittered exponential backoff.
+    
+    With stream=True this only retries opening the stream. An error partway
+    through it is raised from _gemini_request, and the caller falls back.
+    """
+    global _gemini_retry
+    if _gemini_retry is None:
+        from google.api_core import exceptions, retry
+        _gemini_retry = retry.Retry(
+            predicate=retry.if_exception_type(
+                exceptions.ResourceExhausted,
+                exceptions.ServiceUnavailable,
+                exceptions.InternalServerError,
+                exceptions.DeadlineExceeded,
+            ),
+            initial=LLM_RETRY_INITIAL,
+            maximum=LLM_RETRY_MAX_DELAY,
+            multiplier=2.0,
+            deadline=LLM_RETRY_DEADLINE
+        )
+    return _gemini_retry
+
+
+def _groq_score_captions(image: Optional[RoundImage], captions: list[dict]) -> list[dict]:
+    """Score captions using Groq API. Logs and re-raises on error (the caller falls back)."""
+    if _groq_client is None:
+        raise RuntimeError("Groq client not configured")
+    
+    try:
+        return _groq_request(image, captions)
         
     except json.JSONDecodeError as e:
         print(f"Failed to parse Groq response as JSON: {e}")
-        return _fake_score_captions(captions)
+        raise
     except Exception as e:
         print(f"Groq scoring error: {e}")
-        return _fake_score_captions(captions)
+        raise
 
 
-def _gemini_score_captions(image: Image.Image, captions: list[dict]) -> list[dict]:
-    """Score captions using Gemini API."""
+def _gemini_score_captions(image: Optional[RoundImage], captions: list[dict]) -> list[dict]:
+    """Score captions using Gemini API. Logs and re-raises on error (the caller falls back)."""
     if _gemini_model is None:
-        return _fake_score_captions(captions)
-    
-    prompt = _build_prompt(captions, has_image=True)
+        raise RuntimeError("Gemini model not configured")
     
     try:
-        response = _gemini_model.generate_content([image, prompt])
-        response_text = response.text
-        return _parse_llm_response(response_text, captions)
+        return _gemini_request(image, captions)
         
     except json.JSONDecodeError as e:
         print(f"Failed to parse Gemini response as JSON: {e}")
-        return _fake_score_captions(captions)
+        raise
     except Exception as e:
         print(f"Gemini scoring error: {e}")
-        return _fake_score_captions(captions)
+        raise
+
+
+def _hedged_score_captions(image: Optional[RoundImage], captions: list[dict]) -> list[dict]:
+    """
+    Query Groq and Gemini concurrently and use the first valid response.
+    
+    Hedges against one provider being slow or rate-limited. The slower
+    request is left to finish in the background and its result ignored.
+    Raises if neither provider returns results.
+    """
+    futures = {
+        _hedge_executor.submit(_groq_request, image, captions): 'Groq',
+        _hedge_executor.submit(_gemini_request, image, captions): 'Gemini',
+    }
+    pending = set(futures)
+    
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            try:
+                results = future.result()
+            except Exception as e:
+                print(f"{futures[future]} scoring error (hedged): {e}")
+                continue
+            if results:
+                for other in pending:
+                    other.cancel()
+                return results
+    
+    raise RuntimeError("No hedged LLM request returned results")
+
+
+# Pre-defined roast comments for fake mode (harsh -> neutral -> positive-ish)
+FAKE_ROAST_COMMENTS = (
+    "This is what happens when you let interns write memes.",
+    "I've seen better captions on a milk carton.",
+    "Did you write this with your eyes closed?",
+    "My grandmother's cat could do better, and she's been dead for years.",
+    "This is so bad it's almost impressive. Almost.",
+    "Were you trying to be funny, or was that an accident?",
+    "I've had more laughs at a funeral.",
+    "This caption is the human equivalent of a participation trophy.",
+    "Somewhere, a comedy writer just felt a disturbance in the force.",
+    "If mediocrity was a caption, this would be it.",
+    "Actually not terrible. I'm as surprised as you are.",
+    "Finally, someone who understands cats!",
+    "This made me snort. Well done, you absolute legend.",
+)
+_FAKE_HARSH = FAKE_ROAST_COMMENTS[:5]
+_FAKE_NEUTRAL = FAKE_ROAST_COMMENTS[5:10]
+_FAKE_POSITIVE = FAKE_ROAST_COMMENTS[-3:]
 
 
 def _fake_score_captions(captions: list[dict]) -> list[dict]:
@@ -258,64 +843,56 @@ def _fake_score_captions(captions: list[dict]) -> list[dict]:
     """
     results = []
     
-    # Pre-defined roast comments for fake mode
-    roast_comments = [
-        "This is what happens when you let interns write memes.",
-        "I've seen better captions on a milk carton.",
-        "Did you write this with your eyes closed?",
-        "My grandmother's cat could do better, and she's been dead for years.",
-        "This is so bad it's almost impressive. Almost.",
-        "Were you trying to be funny, or was that an accident?",
-        "I've had more laughs at a funeral.",
-        "This caption is the human equivalent of a participation trophy.",
-        "Somewhere, a comedy writer just felt a disturbance in the force.",
-        "If mediocrity was a caption, this would be it.",
-        "Actually not terrible. I'm as surprised as you are.",
-        "Finally, someone who understands cats!",
-        "This made me snort. Well done, you absolute legend.",
-    ]
-    
     for caption_data in captions:
         caption = caption_data.get('caption', '')
         player_name = caption_data.get('player_name', 'Unknown')
         
-        # Generate deterministic score based on caption content
-        caption_hash = hashlib.md5(caption.encode()).hexdigest()
-        base_score = int(caption_hash[:2], 16) % 11  # 0-10
-        
-        # Add some variation based on word count and length
-        word_count = len(caption.split())
-        length_bonus = min(2, word_count // 3)  # Bonus for longer captions
-        
-        # Penalize very short or very long captions
-        if word_count < 3:
-            base_score = max(0, base_score - 2)
-        elif word_count > 12:
-            base_score = max(0, base_score - 1)
-        
-        final_score = max(0, min(10, base_score + length_bonus))
-        
-        # Pick a roast comment based on score
-        if final_score >= 8:
-            comment_pool = roast_comments[-3:]  # Positive-ish
-        elif final_score >= 5:
-            comment_pool = roast_comments[5:10]  # Neutral
-        else:
-            comment_pool = roast_comments[:5]  # Harsh
-        
-        # Deterministic comment selection
-        comment_idx = int(caption_hash[2:4], 16) % len(comment_pool)
+        final_score, roast_comment = _fake_score_one(caption)
         
         results.append({
             'player_name': player_name,
             'caption': caption,
             'score': final_score,
-            'roast_comment': comment_pool[comment_idx]
+            'roast_comment': roast_comment
         })
     
     return results
 
 
+@functools.lru_cache(maxsize=4096)
+def _fake_score_one(caption: str) -> tuple[int, str]:
+    """Deterministically score a single caption. Returns (score, roast_comment)."""
+    # Two raw digest bytes are all we need - no hex formatting or parsing
+    caption_hash = hashlib.blake2b(caption.encode(), digest_size=2).digest()
+    base_score = caption_hash[0] % 11  # 0-10
+    
+    # Add some variation based on word count and length
+    word_count = len(caption.split())
+    length_bonus = min(2, word_count // 3)  # Bonus for longer captions
+    
+    # Penalize very short or very long captions
+    if word_count < 3:
+        base_score = max(0, base_score - 2)
+    elif word_count > 12:
+        base_score = max(0, base_score - 1)
+    
+    final_score = base_score + length_bonus
+    final_score = 0 if final_score < 0 else 10 if final_score > 10 else final_score
+    
+    # Pick a roast comment based on score
+    if final_score >= 8:
+        comment_pool = _FAKE_POSITIVE
+    elif final_score >= 5:
+        comment_pool = _FAKE_NEUTRAL
+    else:
+        comment_pool = _FAKE_HARSH
+    
+    # Deterministic comment selection
+    comment_idx = caption_hash[1] % len(comment_pool)
+    
+    return final_score, comment_pool[comment_idx]
+
+
 def test_api_connection() -> tuple[bool, str]:
     """Test if the LLM API is working."""
     if is_fake_mode():
@@ -323,9 +900,9 @@ def test_api_connection() -> tuple[bool, str]:
     
     if not configure_api():
         providers = []
-        if GROQ_AVAILABLE:
+        if _load_groq():
             providers.append("GROQ_API_KEY")
-        if GENAI_AVAILABLE:
+        if _load_genai():
             providers.append("GOOGLE_API_KEY")
         
         if not providers:
@@ -10,8 +10,13 @@ Run with: python main.py
 
 import os
 import time
+import asyncio
+import functools
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
+from typing import Mapping, Optional
 
 import gradio as gr
 
@@ -32,28 +37,226 @@ import llm
 # --- Configuration ---
 DEFAULT_ROUNDS = int(os.environ.get("ROUNDS_PER_GAME", "3"))
 MAX_CAPTION_WORDS = 15
+QUEUE_CONCURRENCY = 32  # events processed at once per event listener
+QUEUE_MAX_SIZE = 200  # queued events before new ones are rejected as busy
+MAX_THREADS = 64  # worker threads for the remaining sync handlers
+MAX_LIVE_SESSIONS = int(os.environ.get("MAX_LIVE_SESSIONS", "256"))  # in-memory session states kept
+PLAYERS_CACHE_TTL = 1.0  # seconds a session's player list is reused across handlers
+SESSION_UPDATE_KEEPALIVE = 30.0  # seconds a UI update stream waits before re-checking its session
+SESSION_UPDATE_COALESCE = 0.05  # seconds to gather a burst of changes into one UI update
+NEXT_IMAGE_TIMEOUT = 5  # seconds to wait for a prefetched image before fetching fresh
+REFRESH_DEBOUNCE = 0.2  # seconds within which a player's repeat Refresh clicks are no-ops
+
+# Fetches the next round's image while the current round is being scored
+_image_prefetch_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="round-prefetch")
 
 
 # --- Session State (per-session data not in DB) ---
 # This holds ephemeral state like current image
 class SessionState:
+    # No per-instance __dict__: one of these is kept for every live session
+    __slots__ = (
+        "session_id",
+        "current_image_bytes", "current_image_path", "current_image_url",
+        "current_image_description", "next_image_future",
+        "submitted_mask", "player_bit", "n_players_cached",
+        "lock", "scoring_in_progress", "scoring_task",
+        "cached_player_list_key", "cached_player_list",
+        "players_version", "last_players_version", "last_refresh_key",
+        "_players_cached", "_players_cache_ts",
+        "version", "waiters", "last_manual_refresh",
+    )
+    
     def __init__(self, session_id: str):
         self.session_id = session_id
-        self.current_image = None
+        self.current_image_bytes: Optional[bytes] = None  # JPEG; the decoded image isn't kept
+        self.current_image_path: Optional[str] = None  # On-disk copy served to every viewer
         self.current_image_url = None
-        self.submissions_this_round: set = set()  # player_ids who submitted
-        self.last_player_list_hash: str = ""  # Track changes to avoid flicker
+        self.current_image_description: Optional[str] = None
+        self.submitted_mask: int = 0  # Bit i set = player with bit index i submitted
+        self.player_bit: dict[str, int] = {}  # player_id -> bit index
+        self.n_players_cached: int = 0
+        self.next_image_future: Optional[Future] = None  # Prefetched (JPEG bytes, url, path, description) for next round
+        self.lock = threading.Lock()  # Guards submission check-then-act and scoring_in_progress
+        self.scoring_in_progress = False
+        self.scoring_task: Optional[asyncio.Task] = None  # Background scoring, kept referenced until done
+        self.cached_player_list_key: Optional[tuple] = None  # Inputs of the cached table
+        self.cached_player_list: dict = {}
+        self.players_version: int = 0  # Bumped when players join or submit
+        self.last_players_version: Optional[int] = None  # players_version last sent to host UI, avoids flicker
+        self.last_refresh_key: Optional[tuple] = None  # (status, game, round) last rendered by host refresh
+        self._players_cached: list[dict] = []
+        self._players_cache_ts: float = 0.0  # time.monotonic() of last refresh, 0 = stale
+        self.version: int = 0  # Bumped on every change connected UIs should see
+        self.waiters: set[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()  # UI streams waiting on a change
+        self.last_manual_refresh: dict[str, float] = {}  # player_id -> time.monotonic() of last Refresh click
+    
+    def add_player(self, player_id: str) -> None:
+        """Assign the player a bit in the submission mask."""
+        if player_id not in self.player_bit:
+            self.player_bit[player_id] = len(self.player_bit)
+            self.n_players_cached = len(self.player_bit)
+            self.players_version += 1
+    
+    def mark_submitted(self, player_id: str) -> None:
+        self.add_player(player_id)
+        mask = self.submitted_mask | 1 << self.player_bit[player_id]
+        if mask != self.submitted_mask:
+            self.submitted_mask = mask
+            self.players_version += 1
+    
+    def has_submitted(self, player_id: str) -> bool:
+        bit = self.player_bit.get(player_id)
+        return bit is not None and bool(self.submitted_mask >> bit & 1)
+    
+    @property
+    def submitted_count(self) -> int:
+        return self.submitted_mask.bit_count()
+    
+    def reset_submissions(self) -> None:
+        if self.submitted_mask:
+            self.submitted_mask = 0
+            self.players_version += 1
+
 
+# Least recently used first; evicted states are rebuilt from storage on demand
+_session_states: OrderedDict[str, SessionState] = OrderedDict()
+_session_states_lock = threading.Lock()  # Handlers run on many threads; guards the LRU order too
 
-_session_states: dict[str, SessionState] = {}
 
+def get_session_state(session_id: str, session: Optional[Mapping] = None) -> Optional[SessionState]:
+    """Get or create session state. Pass the session row if the caller already has it."""
+    with _session_states_lock:
+        state = _session_states.get(session_id)
+        if state is not None:
+            _session_states.move_to_end(session_id)
+            return state
+    
+    # One (usually cached) row read; it also warms the row cache for the caller
+    if session is None and storage.get_session(session_id) is None:
+        return None
+    state = SessionState(session_id)
+    for p in storage.get_players(session_id):
+        state.add_player(p['player_id'])
+    return _store_session_state(state)
 
-def get_session_state(session_id: str) -> Optional[SessionState]:
-    """Get or create session state."""
-    if session_id not in _session_states:
-        if storage.session_exists(session_id):
-            _session_states[session_id] = SessionState(session_id)
-    return _session_states.get(session_id)
+
+def _store_session_state(state: SessionState) -> SessionState:
+    """
+    Track a session's state, evicting the least recently used past MAX_LIVE_SESSIONS.
+    If another thread stored a state for the session first, that one is kept and returned.
+    """
+    evicted = []
+    with _session_states_lock:
+        existing = _session_states.get(state.session_id)
+        if existing is not None:
+            _session_states.move_to_end(state.session_id)
+            return existing
+        _session_states[state.session_id] = state
+        while len(_session_states) > MAX_LIVE_SESSIONS:
+            evicted.append(_session_states.popitem(last=False)[1])
+    for old in evicted:
+        _release_session_state(old)
+    return state
+
+
+def _pop_session_state(session_id: str) -> Optional[SessionState]:
+    """Stop tracking a session's state and release it."""
+    with _session_states_lock:
+        state = _session_states.pop(session_id, None)
+    if state:
+        _release_session_state(state)
+    return state
+
+
+def _release_session_state(state: SessionState) -> None:
+    """Drop a session's image data and rendered views so they can be freed."""
+    state.current_image_bytes = None
+    state.current_image_path = None
+    if state.next_image_future is not None:
+        state.next_image_future.cancel()
+        state.next_image_future = None
+    _format_cache.pop(state.session_id, None)
+
+
+def notify_session_changed(session_id: str) -> None:
+    """Wake every UI update stream for this session. Safe to call from any thread."""
+    state = _session_states.get(session_id)
+    if not state:
+        return
+    state.version += 1
+    for loop, event in list(state.waiters):
+        loop.call_soon_threadsafe(event.set)
+
+
+async def wait_for_session_change(
+    state: SessionState,
+    seen_version: int,
+    timeout: float = SESSION_UPDATE_KEEPALIVE
+) -> int:
+    """
+    Wait until the session's version moves past seen_version (or timeout).
+    Returns the current version; equal to seen_version if it timed out.
+    
+    Once woken, waits a further SESSION_UPDATE_COALESCE so a burst of changes
+    (e.g. several players submitting at once) is rendered once.
+    """
+    # Register before checking the version so a concurrent notify isn't missed
+    waiter = (asyncio.get_running_loop(), asyncio.Event())
+    state.waiters.add(waiter)
+    try:
+        if state.version == seen_version:
+            await asyncio.wait_for(waiter[1].wait(), timeout)
+    except asyncio.TimeoutError:
+        return state.version
+    finally:
+        state.waiters.discard(waiter)
+    
+    await asyncio.sleep(SESSION_UPDATE_COALESCE)
+    return state.version
+
+
+# Shared updates for the render paths. Safe to reuse because they have no
+# "value": Gradio pops "value" out of update dicts in place when sending
+# them, so updates that carry one must be built fresh each time.
+_NO_CHANGE = gr.update()
+_HIDE = gr.update(visible=False)
+_SHOW = gr.update(visible=True)
+_DISABLE = gr.update(interactive=False)
+_ENABLE = gr.update(interactive=True)
+_NO_REFRESH = (_NO_CHANGE,) * 6  # Player view outputs, all unchanged
+
+
+def _drop_unchanged(values: tuple, last_sent: list) -> Optional[tuple]:
+    """
+    Swap outputs equal to what this stream last sent for a no-op update, so the
+    frontend skips re-rendering them. Records sent values in last_sent.
+    Returns None if nothing changed at all.
+    """
+    diffed = []
+    for i, value in enumerate(values):
+        if value == _NO_CHANGE or value == last_sent[i]:
+            diffed.append(_NO_CHANGE)
+        else:
+            # Copy updates, since Gradio strips their "value" once sent
+            last_sent[i] = dict(value) if isinstance(value, dict) else value
+            diffed.append(value)
+    if all(value is _NO_CHANGE for value in diffed):
+        return None
+    return tuple(diffed)
+
+
+def _get_players_cached(session_id: str, ttl: float = PLAYERS_CACHE_TTL) -> list[dict]:
+    """Get the session's players, reusing a read from the last `ttl` seconds."""
+    state = get_session_state(session_id)
+    if not state:
+        return storage.get_players(session_id)
+    
+    now = time.monotonic()
+    if now - state._players_cache_ts >= ttl:
+        state._players_cached = storage.get_players(session_id)
+        state._players_cache_ts = now
+    return state._players_cached
 
 
 # --- Game Logic ---
@@ -67,11 +270,17 @@ def create_new_session(host_name: str) -> tuple[str, str, str]:
         total_rounds=DEFAULT_ROUNDS,
         round_timer=0  # No timer
     )
-    _session_states[session_id] = SessionState(session_id)
+    state = SessionState(session_id)
+    _store_session_state(state)
     
     # Add host as first player
     host_name = host_name.strip() or "Host"
     host_player_id = storage.add_player(session_id, host_name, is_host=True)
+    state.add_player(host_player_id)
+    state._players_cache_ts = 0.0
+    
+    # Fetch round 1's image while players are joining
+    _prefetch_next_image(state)
     
     # In production, this would be the actual URL
     join_url = f"Session Code: {session_id}"
@@ -86,26 +295,29 @@ def join_session(session_id: str, player_name: str) -> tuple[bool, str, str]:
     """
     session_id = session_id.strip().upper()
     
-    if not storage.session_exists(session_id):
-        return False, f"Session '{session_id}' not found. Check the code and try again.", ""
-    
     session = storage.get_session(session_id)
-    if session and session['status'] == 'finished':
+    if session is None:
+        return False, f"Session '{session_id}' not found. Check the code and try again.", ""
+    if session['status'] == 'finished':
         return False, "This session has ended.", ""
     
     player_name = player_name.strip() or "Anonymous"
     player_id = storage.add_player(session_id, player_name, is_host=False)
     
     # Ensure session state exists
-    get_session_state(session_id)
+    state = get_session_state(session_id, session)
+    if state:
+        state.add_player(player_id)
+        state._players_cache_ts = 0.0
+    notify_session_changed(session_id)
     
     return True, f"Welcome, {player_name}! Waiting for host to start the round...", player_id
 
 
-def start_round(session_id: str) -> tuple[bool, str, Optional[object]]:
+async def start_round(session_id: str) -> tuple[bool, str, Optional[object]]:
     """
     Start a new round. Host-only action.
-    Returns (success, message, image).
+    Returns (success, message, image), where image is the on-disk path when available.
     """
     session = storage.get_session(session_id)
     if not session:
@@ -114,10 +326,11 @@ def start_round(session_id: str) -> tuple[bool, str, Optional[object]]:
     # Check if game is over (all rounds completed)
     if session['current_round'] >= session['total_rounds']:
         storage.update_session_status(session_id, 'game_over')
+        notify_session_changed(session_id)
         return False, "Game is over! All rounds completed. Start a new game to continue.", None
     
     # Get session state
-    state = get_session_state(session_id)
+    state = get_session_state(session_id, session)
     if not state:
         return False, "Session state error.", None
     
@@ -125,32 +338,85 @@ def start_round(session_id: str) -> tuple[bool, str, Optional[object]]:
     round_num = storage.increment_round(session_id)
     game_num = session['current_game']
     
-    # Fetch new cat image
-    image, image_url = images.fetch_random_cat()
-    state.current_image = image
+    # Use the image prefetched at the end of the last round, if any
+    image_bytes, image_url, image_path, description = await _take_next_image(state)
+    state.current_image_bytes = image_bytes
+    state.current_image_path = image_path
     state.current_image_url = image_url
-    state.submissions_this_round = set()
-    state.last_player_list_hash = ""  # Reset to force UI update
+    state.current_image_description = description
+    state.reset_submissions()
+    state.last_players_version = None  # Reset to force UI update
+    
+    # Fetch the next round's image while players write captions
+    if round_num < session['total_rounds']:
+        _prefetch_next_image(state)
     
     # Record round in DB
     storage.start_round(session_id, game_num, round_num, image_url)
     storage.update_session_status(session_id, 'playing')
+    notify_session_changed(session_id)
     
-    player_count = len(storage.get_players(session_id))
-    return True, f"Round {round_num} of {session['total_rounds']} started! Waiting for {player_count} players to submit...", image
+    player_count = len(_get_players_cached(session_id))
+    return True, f"Round {round_num} of {session['total_rounds']} started! Waiting for {player_count} players to submit...", _round_image_value(state)
+
+
+def _fetch_round_image() -> tuple[bytes, str, Optional[str], str]:
+    """Fetch a cat and prepare it for a round. Runs on a worker thread."""
+    image, image_url = images.fetch_random_cat()
+    return _prepare_round_image(image, image_url)
+
+
+def _prepare_round_image(image, image_url: str) -> tuple[bytes, str, Optional[str], str]:
+    """
+    Write the image to the round image cache and describe it for the LLM,
+    so both are ready before the round starts rather than at scoring time.
+    Only the JPEG bytes are returned; the decoded image is dropped here.
+    """
+    return (
+        images.image_to_bytes(image, "JPEG"),
+        image_url,
+        images.save_round_image(image),
+        images.describe_image_for_llm(image),
+    )
+
 
+def _round_image_value(state: SessionState) -> Optional[object]:
+    """Value for the cat gr.Image: the served file, else a copy decoded from the JPEG bytes."""
+    if state.current_image_path:
+        return state.current_image_path
+    if state.current_image_bytes:
+        return images.bytes_to_image(state.current_image_bytes)
+    return None
 
-def check_all_submitted(session_id: str) -> bool:
+
+def _prefetch_next_image(state: SessionState) -> None:
+    """Start fetching the session's next round image unless one is already pending."""
+    if state.next_image_future is None:
+        state.next_image_future = _image_prefetch_executor.submit(_fetch_round_image)
+
+
+async def _take_next_image(state: SessionState) -> tuple[bytes, str, Optional[str], str]:
+    """Pop the session's prefetched (JPEG bytes, url, path, description), falling back to a fresh fetch."""
+    future = state.next_image_future
+    state.next_image_future = None
+    if future is not None:
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), NEXT_IMAGE_TIMEOUT)
+        except Exception as e:
+            print(f"Image prefetch error: {e}")
+    image, image_url = await images.fetch_random_cat_async()
+    return await asyncio.to_thread(_prepare_round_image, image, image_url)
+
+
+def check_all_submitted(session_id: str, session: Optional[Mapping] = None) -> bool:
     """Check if all players have submitted captions this round."""
-    state = get_session_state(session_id)
-    if not state:
+    session = session or storage.get_session(session_id)
+    if not session:
         return False
     
-    players = storage.get_players(session_id)
-    total_players = len(players)
-    submitted_count = len(state.submissions_this_round)
-    
-    return submitted_count >= total_players and total_players > 0
+    return storage.all_players_submitted(
+        session_id, session['current_game'], session['current_round']
+    )
 
 
 def submit_caption(
@@ -169,48 +435,88 @@ def submit_caption(
     if session['status'] != 'playing':
         return False, "No round in progress.", False
     
-    state = get_session_state(session_id)
+    state = get_session_state(session_id, session)
     if not state:
         return False, "Session state error.", False
     
-    # Check if already submitted
-    if player_id in state.submissions_this_round:
-        return False, "You've already submitted a caption this round!", False
-    
     game_num = session['current_game']
     round_num = session['current_round']
     
     # Enforce word limit
-    words = caption.strip().split()
+    # maxsplit bounds the work for huge pastes; the remainder lands in one extra item
+    words = caption.strip().split(maxsplit=MAX_CAPTION_WORDS)
     if len(words) > MAX_CAPTION_WORDS:
         return False, f"Caption too long! Maximum {MAX_CAPTION_WORDS} words.", False
     
     if len(words) == 0:
         return False, "Please enter a caption.", False
     
-    # Submit
-    success = storage.submit_caption(session_id, game_num, round_num, player_id, caption)
-    if success:
-        state.submissions_this_round.add(player_id)
+    with state.lock:
+        # Check if already submitted
+        if state.has_submitted(player_id):
+            return False, "You've already submitted a caption this round!", False
+        
+        # Submit
+        success = storage.submit_caption(session_id, game_num, round_num, player_id, caption)
+        if not success:
+            return False, "You've already submitted a caption this round!", False
+        
+        state.mark_submitted(player_id)
         
         # Check if all players have submitted
         all_submitted = check_all_submitted(session_id)
-        
-        if all_submitted:
-            return True, "✅ Caption submitted! All players done - scoring now...", True
-        else:
-            players = storage.get_players(session_id)
-            remaining = len(players) - len(state.submissions_this_round)
-            return True, f"✅ Caption submitted! Waiting for {remaining} more player(s)...", False
-    else:
-        return False, "You've already submitted a caption this round!", False
+        remaining = state.n_players_cached - state.submitted_count
+    
+    notify_session_changed(session_id)
+    
+    if all_submitted:
+        return True, "✅ Caption submitted! All players done - scoring now...", True
+    return True, f"✅ Caption submitted! Waiting for {remaining} more player(s)...", False
 
 
-def end_round_and_score(session_id: str) -> tuple[bool, str, list[dict], bool]:
+async def end_round_and_score(session_id: str) -> tuple[bool, str, list[dict], bool]:
     """
     End the current round and score all captions.
+    Scoring is awaited so the event loop stays free for other sessions.
     Returns (success, message, results, is_game_over).
     """
+    state = get_session_state(session_id)
+    if not state:
+        return False, "Session not found.", [], False
+    
+    # Only one caller scores a round - a concurrent submit or auto-refresh backs off
+    with state.lock:
+        if state.scoring_in_progress:
+            return False, "Scoring already in progress.", [], False
+        state.scoring_in_progress = True
+    
+    try:
+        return await _score_round(session_id, state)
+    finally:
+        state.scoring_in_progress = False
+
+
+def start_background_scoring(session_id: str) -> None:
+    """Score the current round in a background task on the running event loop."""
+    state = get_session_state(session_id)
+    if not state:
+        return
+    state.scoring_task = asyncio.get_running_loop().create_task(_score_in_background(session_id))
+
+
+async def _score_in_background(session_id: str) -> None:
+    """Run end_round_and_score, logging instead of raising since nobody awaits it.
+    
+    If auto-refresh got to the round first, the scoring guard makes this a no-op.
+    """
+    try:
+        await end_round_and_score(session_id)
+    except Exception as e:
+        print(f"Background scoring error for {session_id}: {e}")
+
+
+async def _score_round(session_id: str, state: SessionState) -> tuple[bool, str, list[dict], bool]:
+    """Score the current round's captions. Caller must hold the scoring flag."""
     session = storage.get_session(session_id)
     if not session:
         return False, "Session not found.", [], False
@@ -218,10 +524,6 @@ def end_round_and_score(session_id: str) -> tuple[bool, str, list[dict], bool]:
     if session['status'] != 'playing':
         return False, "No round in progress.", [], False
     
-    state = get_session_state(session_id)
-    if not state:
-        return False, "Session state error.", [], False
-    
     game_num = session['current_game']
     round_num = session['current_round']
     
@@ -231,17 +533,12 @@ def end_round_and_score(session_id: str) -> tuple[bool, str, list[dict], bool]:
     if not captions:
         return False, "No captions submitted this round!", [], False
     
-    # Prepare for LLM scoring
-    caption_data = [
-        {'player_name': c['player_name'], 'caption': c['caption']}
-        for c in captions
-    ]
-    
-    # Score with LLM
-    scored_results = llm.score_captions(
-        state.current_image,
-        caption_data,
-        images.describe_image_for_llm(state.current_image) if state.current_image else None
+    # Score with LLM (it only reads 'player_name' and 'caption' from each row)
+    scored_results = await llm.score_captions_async(
+        state.current_image_bytes,
+        captions,
+        state.current_image_description,
+        image_url=state.current_image_url
     )
     
     # Update scores in DB
@@ -255,6 +552,9 @@ def end_round_and_score(session_id: str) -> tuple[bool, str, list[dict], bool]:
         storage.update_session_status(session_id, 'game_over')
     else:
         storage.update_session_status(session_id, 'lobby')
+        # Normally already started with the round; covers a failed prefetch
+        _prefetch_next_image(state)
+    notify_session_changed(session_id)
     
     return True, f"Round {round_num} complete!", scored_results, is_game_over
 
@@ -271,78 +571,127 @@ def start_new_game(session_id: str) -> tuple[bool, str, int]:
     new_game_num = storage.start_new_game(session_id)
     
     # Reset session state
-    state = get_session_state(session_id)
+    state = get_session_state(session_id, session)
     if state:
-        state.current_image = None
+        state.current_image_bytes = None
+        state.current_image_path = None
         state.current_image_url = None
-        state.submissions_this_round = set()
-        state.last_player_list_hash = ""  # Reset to force UI update
+        state.current_image_description = None
+        state.reset_submissions()
+        state.last_players_version = None  # Reset to force UI update
+        _prefetch_next_image(state)
+    notify_session_changed(session_id)
     
     return True, f"🎮 Game {new_game_num} started! Ready for round 1.", new_game_num
 
 
-def format_player_list(session_id: str, show_submission_status: bool = False) -> str:
-    """Format the player list as markdown, optionally showing submission status."""
+# Table values for the player list / scoreboard Dataframes. Gradio diffs
+# these row by row, so one player submitting only re-renders their row.
+_EMPTY_PLAYER_LIST = {"headers": ["Player", "Status"], "data": []}
+_EMPTY_SCOREBOARD = {"headers": ["Rank", "Player", "Points"], "data": []}
+
+
+def format_player_list(
+    session_id: str,
+    show_submission_status: bool = False,
+    session: Optional[Mapping] = None
+) -> dict:
+    """Format the player list as a table, optionally showing submission status."""
     if not session_id:
-        return "_No session active_"
+        return _EMPTY_PLAYER_LIST
     
-    players = storage.get_players(session_id)
+    players = _get_players_cached(session_id)
     if not players:
-        return "_No players yet_"
+        return _EMPTY_PLAYER_LIST
     
-    state = get_session_state(session_id)
-    session = storage.get_session(session_id)
-    is_playing = session and session['status'] == 'playing'
+    session = session or storage.get_session(session_id)
+    state = get_session_state(session_id, session)
+    is_playing = bool(session and session['status'] == 'playing')
     
-    lines = []
+    # Reuse the last rendering if nothing it depends on has changed
+    if state:
+        key = (state.submitted_mask, len(players), show_submission_status, is_playing)
+        if key == state.cached_player_list_key:
+            return state.cached_player_list
+    
+    rows = []
     for p in players:
         host_badge = " 👑" if p.get('is_host') else ""
         
         # Show checkmark if player has submitted (only during active round)
         if show_submission_status and is_playing and state:
-            if p['player_id'] in state.submissions_this_round:
-                status = " ✅"
+            if state.has_submitted(p['player_id']):
+                status = "✅"
             else:
-                status = " ⏳"
+                status = "⏳"
         else:
             status = ""
         
-        lines.append(f"- {p['name']}{host_badge}{status}")
+        rows.append([f"{p['name']}{host_badge}", status])
     
-    submitted_count = len(state.submissions_this_round) if state else 0
+    submitted_count = state.submitted_count if state else 0
     total_count = len(players)
     
     if show_submission_status and is_playing:
-        header = f"**{submitted_count}/{total_count} submitted:**"
+        headers = ["Player", f"{submitted_count}/{total_count} submitted"]
     else:
-        header = f"**{total_count} player(s):**"
+        headers = [f"{total_count} player(s)", "Status"]
     
-    return header + "\n\n" + "\n".join(lines)
+    table = {"headers": headers, "data": rows}
+    if state:
+        state.cached_player_list_key = key
+        state.cached_player_list = table
+    return table
 
 
-def format_scoreboard(session_id: str) -> str:
-    """Format the scoreboard as markdown."""
-    session = storage.get_session(session_id)
+# session_id -> {view name: (storage.get_session_version at render time, view)}.
+# Keyed per session so releasing one drops a single entry; single dict
+# get/setdefault/pop calls are atomic, so handler threads need no lock.
+_format_cache: dict[str, dict[str, tuple[int, object]]] = {}
+
+
+def _memoize_by_session_version(render):
+    """Cache a session_id -> rendered view until the session's stored data changes."""
+    @functools.wraps(render)
+    def wrapper(session_id: str):
+        name = render.__name__
+        # Read the version first: a write during render leaves the entry stale, not wrong
+        version = storage.get_session_version(session_id)
+        cached = _format_cache.get(session_id, {}).get(name)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        view = render(session_id)
+        _format_cache.setdefault(session_id, {})[name] = (version, view)
+        return view
+    return wrapper
+
+
+_MEDALS = ("🥇 ", "🥈 ", "🥉 ")
+
+
+def _format_standings(scoreboard: list[dict]) -> str:
+    """Format scoreboard entries as one markdown line each, medals for the top 3."""
+    return "\n".join(
+        f"{_MEDALS[e['rank'] - 1] if e['rank'] <= 3 else ''}**{e['name']}** — {e['total_score']} pts"
+        for e in scoreboard
+    )
+
+
+@_memoize_by_session_version
+def format_scoreboard(session_id: str) -> dict:
+    """Format the scoreboard as a table, medals for the top 3."""
+    session = storage.get_session(session_id) if session_id else None
     if not session:
-        return "_No scores yet_"
+        return _EMPTY_SCOREBOARD
     
     scoreboard = storage.get_game_scoreboard(session_id, session['current_game'])
-    if not scoreboard:
-        return "_No scores yet_"
-    
-    lines = [f"### 🏆 Game {session['current_game']} Scoreboard", ""]
-    for entry in scoreboard:
-        medal = ""
-        if entry['rank'] == 1:
-            medal = "🥇 "
-        elif entry['rank'] == 2:
-            medal = "🥈 "
-        elif entry['rank'] == 3:
-            medal = "🥉 "
-        
-        lines.append(f"{medal}**{entry['name']}** — {entry['total_score']} pts")
-    
-    return "\n".join(lines)
+    return {
+        "headers": _EMPTY_SCOREBOARD["headers"],
+        "data": [
+            [_MEDALS[e['rank'] - 1].strip() if e['rank'] <= 3 else str(e['rank']), e['name'], e['total_score']]
+            for e in scoreboard
+        ],
+    }
 
 
 def format_round_results(results: list[dict], round_num: int) -> str:
@@ -353,25 +702,35 @@ def format_round_results(results: list[dict], round_num: int) -> str:
     # Sort by score descending
     sorted_results = sorted(results, key=lambda x: x.get('score', 0), reverse=True)
     
-    lines = [f"### 🎯 Round {round_num} Results", ""]
-    
-    for i, r in enumerate(sorted_results):
-        score = r.get('score', 0)
-        name = r.get('player_name', 'Unknown')
-        caption = r.get('caption', '')
-        roast = r.get('roast_comment', '')
-        
-        winner_badge = " 👑" if i == 0 else ""
-        
-        lines.append(f"**{name}**{winner_badge} — {score}/10")
-        lines.append(f"> \"{caption}\"")
-        if roast:
-            lines.append(f"> _🔥 {roast}_")
-        lines.append("")
+    entries = "\n".join(_format_result_entry(r, is_winner=(i == 0)) for i, r in enumerate(sorted_results))
+    return f"### 🎯 Round {round_num} Results\n\n{entries}"
+
+
+def _format_result_entry(r: dict, is_winner: bool) -> str:
+    """One caption's result block: name and score, the caption, and any roast."""
+    winner_badge = " 👑" if is_winner else ""
+    roast = r.get('roast_comment', '')
+    roast_line = f"> _🔥 {roast}_\n" if roast else ""
+    return (
+        f"**{r.get('player_name', 'Unknown')}**{winner_badge} — {r.get('score', 0)}/10\n"
+        f"> \"{r.get('caption', '')}\"\n"
+        f"{roast_line}"
+    )
+
+
+@_memoize_by_session_version
+def format_current_round_results(session_id: str) -> str:
+    """Format the stored results for the session's current round, if any."""
+    session = storage.get_session(session_id)
+    if not session or session['current_round'] < 1:
+        return ""
     
-    return "\n".join(lines)
+    round_num = session['current_round']
+    results = storage.get_round_captions(session_id, session['current_game'], round_num)
+    return format_round_results(results, round_num) if results else ""
 
 
+@_memoize_by_session_version
 def format_game_over(session_id: str) -> str:
     """Format game over screen with winner."""
     session = storage.get_session(session_id)
@@ -384,32 +743,516 @@ def format_game_over(session_id: str) -> str:
     if not winner:
         return "### Game Over!\n\n_No winner determined._"
     
-    lines = [
-        "# 🎉 GAME OVER! 🎉",
+    return (
+        "# 🎉 GAME OVER! 🎉\n"
+        "\n"
+        f"## 👑 {winner['name']} is the Supreme Cat Meme Champion! 👑\n"
+        f"### Final Score: {winner['total_score']} points\n"
+        "\n"
+        f"_Game {session['current_game']} complete!_\n"
+        "\n"
+        "---\n"
+        "\n"
+        "### Final Standings:\n"
+        "\n"
+        f"{_format_standings(scoreboard)}"
+    )
+
+
+@_memoize_by_session_version
+def format_game_over_with_results(session_id: str) -> str:
+    """The final round's results followed by the game over screen."""
+    results_md = format_current_round_results(session_id)
+    game_over_md = format_game_over(session_id)
+    return f"{results_md}\n\n{game_over_md}" if results_md else game_over_md
+
+
+# --- Host Auto-Refresh ---
+# Rendered each time the session changes. One handler per session status;
+# each returns {output name: value}, and outputs it leaves out are sent as
+# gr.update() (no change).
+
+# Host auto-refresh outputs, in the order they are wired to the update stream
+_HOST_REFRESH_OUTPUTS = ("player_list", "scoreboard", "results", "game_over_group", "game_over")
+
+
+def _refresh_key_changed(state: Optional[SessionState], session: Mapping) -> bool:
+    """Record the session's (status, game, round); True if it differs from the last tick."""
+    key = (session['status'], session['current_game'], session['current_round'])
+    if state is None:
+        return True
+    changed = key != state.last_refresh_key
+    state.last_refresh_key = key
+    return changed
+
+
+async def _refresh_lobby(session_id: str, session: Mapping, state: Optional[SessionState]) -> dict:
+    """Between rounds: show the last round's results."""
+    updates = {
+        "player_list": format_player_list(session_id, show_submission_status=False, session=session),
+        "game_over_group": _HIDE,
+        "game_over": "",
+    }
+    if _refresh_key_changed(state, session):
+        updates["scoreboard"] = format_scoreboard(session_id)
+        updates["results"] = format_current_round_results(session_id)
+    return updates
+
+
+async def _refresh_game_over(session_id: str, session: Mapping, state: Optional[SessionState]) -> dict:
+    """Game finished: show final results and standings."""
+    updates = {
+        "player_list": format_player_list(session_id, show_submission_status=False, session=session),
+        "game_over_group": _SHOW,
+    }
+    if _refresh_key_changed(state, session):
+        updates["scoreboard"] = format_scoreboard(session_id)
+        updates["results"] = format_current_round_results(session_id)
+        updates["game_over"] = format_game_over(session_id)
+    return updates
+
+
+async def _refresh_playing(session_id: str, session: Mapping, state: Optional[SessionState]) -> dict:
+    """Active round: start scoring once everyone is in, else update the player list if it changed."""
+    _refresh_key_changed(state, session)
+    
+    # Results are pushed once scoring moves the round out of 'playing'
+    if state and state.scoring_in_progress:
+        return {}
+    
+    if check_all_submitted(session_id, session):
+        start_background_scoring(session_id)
+        return {}
+    
+    # Only render the player list if someone joined or submitted since it was last sent
+    if state is None:
+        return {"player_list": format_player_list(session_id, show_submission_status=True, session=session)}
+    if state.players_version != state.last_players_version:
+        state.last_players_version = state.players_version
+        return {"player_list": format_player_list(session_id, show_submission_status=True, session=session)}
+    
+    return {}
+
+
+async def _refresh_stopped(session_id: str, session: Mapping, state: Optional[SessionState]) -> dict:
+    """Any other status (e.g. finished): nothing to show."""
+    return {}
+
+
+_HOST_REFRESH_HANDLERS = {
+    'playing': _refresh_playing,
+    'lobby': _refresh_lobby,
+    'game_over': _refresh_game_over,
+}
+
+
+# --- Host UI Handlers ---
+
+def on_create_session(host_name):
+    if not host_name.strip():
+        return (
+            None, None,
+            _SHOW,  # keep create section visible
+            _HIDE,  # hide game section
+            "❌ Please enter your name to start.",
+            "", "", _EMPTY_SCOREBOARD, _EMPTY_PLAYER_LIST,
+            _HIDE, _HIDE,
+            ""
+        )
+    
+    session_id, join_url, host_player_id = create_new_session(host_name)
+    
+    return (
+        session_id,
+        host_player_id,
+        _HIDE,  # hide create section
+        _SHOW,  # show game section
+        "",  # clear create status
+        f"### ✅ Session Created!\n\nYou are **{host_name.strip()}** (Host)\n\nShare the code below with players:",
+        session_id,
+        format_scoreboard(session_id),
+        format_player_list(session_id, show_submission_status=False),
+        _HIDE,  # hide cat image
+        _HIDE,  # hide game over section
+        ""
+    )
+
+
+async def on_start_round(session_id, host_player_id):
+    if not session_id:
+        return (
+            _NO_CHANGE, "",
+            format_player_list(session_id, show_submission_status=True),
+            format_scoreboard(session_id),
+            _HIDE, "",
+            gr.update(value="", interactive=True),  # clear and enable caption input
+            ""  # clear caption status
+        )
+
+    success, msg, image = await start_round(session_id)
+    if success:
+        session = storage.get_session(session_id)
+        round_num = session['current_round'] if session else 0
+        total_rounds = session['total_rounds'] if session else DEFAULT_ROUNDS
+
+        return (
+            gr.update(value=image, visible=True),
+            f"### Round {round_num} of {total_rounds}\n\n{msg}",
+            format_player_list(session_id, show_submission_status=True),
+            _NO_CHANGE,  # Scores only change when a round is scored
+            _HIDE,  # hide game over section
+            "",
+            gr.update(value="", interactive=True),  # clear and enable caption input
+            ""  # clear caption status
+        )
+    return (
+        _HIDE, msg,
+        format_player_list(session_id, show_submission_status=False),
+        format_scoreboard(session_id),
+        _HIDE, "",
+        gr.update(value="", interactive=True),  # clear caption input
+        ""  # clear caption status
+    )
+
+
+async def on_host_submit_caption(session_id, host_player_id, caption):
+    if not session_id or not host_player_id:
+        return "❌ No session active.", format_player_list(session_id, show_submission_status=True), "", _EMPTY_SCOREBOARD, _NO_CHANGE, ""
+    
+    success, message, all_submitted = submit_caption(session_id, host_player_id, caption)
+    
+    # If all players submitted, score in the background and let
+    # auto-refresh pick up the results
+    if all_submitted:
+        start_background_scoring(session_id)
+    
+    # Submitting never changes scores, so the scoreboard is left as is
+    return (
+        message,
+        format_player_list(session_id, show_submission_status=True),
         "",
-        f"## 👑 {winner['name']} is the Supreme Cat Meme Champion! 👑",
-        f"### Final Score: {winner['total_score']} points",
+        _NO_CHANGE,
+        _NO_CHANGE,
+        ""
+    )
+
+
+async def on_end_round(session_id):
+    if not session_id:
+        return (
+            "❌ No session active.", 
+            format_player_list(session_id, show_submission_status=False),
+            "",
+            format_scoreboard(session_id),
+            _HIDE, ""
+        )
+    
+    session = storage.get_session(session_id)
+    round_num = session['current_round'] if session else 0
+    
+    success, msg, results, is_game_over = await end_round_and_score(session_id)
+    
+    if success:
+        if is_game_over:
+            return (
+                "🏁 Game finished! See results below.",
+                format_player_list(session_id, show_submission_status=False),
+                format_round_results(results, round_num),
+                format_scoreboard(session_id),
+                _SHOW,  # show game over section
+                format_game_over(session_id)
+            )
+        
+        return (
+            f"✅ {msg} Ready for next round.",
+            format_player_list(session_id, show_submission_status=False),
+            format_round_results(results, round_num),
+            format_scoreboard(session_id),
+            _HIDE,
+            ""
+        )
+    
+    return (
+        msg,
+        format_player_list(session_id, show_submission_status=True),
         "",
-        f"_Game {session['current_game']} complete!_",
+        format_scoreboard(session_id),
+        _HIDE, ""
+    )
+
+
+def on_new_game(session_id):
+    if not session_id:
+        return "", _HIDE, "", format_scoreboard(session_id)
+    
+    success, msg, game_num = start_new_game(session_id)
+    
+    if success:
+        return (
+            msg,
+            _HIDE,  # hide game over section
+            "",  # clear results
+            format_scoreboard(session_id)
+        )
+    
+    return msg, _SHOW, "", format_scoreboard(session_id)
+
+
+def on_refresh_players(session_id):
+    session = storage.get_session(session_id) if session_id else None
+    is_playing = session and session['status'] == 'playing'
+    return format_player_list(session_id, show_submission_status=is_playing)
+
+
+def on_reset_session(session_id):
+    if not session_id:
+        return "❌ No session active.", _EMPTY_PLAYER_LIST, "", _EMPTY_SCOREBOARD, _HIDE, ""
+    
+    storage.reset_session(session_id)
+    state = get_session_state(session_id)
+    if state:
+        state.current_image_bytes = None
+        state.current_image_path = None
+        state.current_image_url = None
+        state.current_image_description = None
+        state.reset_submissions()
+    notify_session_changed(session_id)
+    
+    return (
+        "✅ Session reset! Players remain, all scores cleared.",
+        format_player_list(session_id, show_submission_status=False),
         "",
-        "---",
+        format_scoreboard(session_id),
+        _HIDE,
+        ""
+    )
+
+
+def on_end_session(session_id):
+    if session_id:
+        storage.update_session_status(session_id, 'finished')
+        notify_session_changed(session_id)  # Lets update streams exit
+        _pop_session_state(session_id)
+    
+    # Reset UI to initial state
+    return (
+        None,  # clear session_id_state
+        None,  # clear host_player_id_state
+        _SHOW,  # show create_session_group
+        _HIDE,  # hide game_section
+        ""  # clear create_status
+    )
+
+
+async def on_host_session_updates(session_id):
+    """Push host UI updates whenever the session changes.
+    
+    Runs for the life of the session: waits for a change notification,
+    then dispatches on session status to a handler that only recomputes
+    the outputs that can change in that state.
+    """
+    seen_version = -1  # Render once straight away
+    last_sent = [None] * len(_HOST_REFRESH_OUTPUTS)
+    while session_id:
+        state = get_session_state(session_id)
+        if not state:
+            return
+        version = await wait_for_session_change(state, seen_version)
+        
+        session = storage.get_session(session_id)
+        if not session or session['status'] == 'finished':
+            return
+        if version == seen_version:
+            continue  # Keepalive timeout, nothing changed
+        seen_version = version
+        
+        handler = _HOST_REFRESH_HANDLERS.get(session['status'], _refresh_stopped)
+        updates = await handler(session_id, session, state)
+        changed = _drop_unchanged(
+            tuple(updates.get(name, _NO_CHANGE) for name in _HOST_REFRESH_OUTPUTS),
+            last_sent
+        )
+        if changed:
+            yield changed
+
+
+# --- Player UI Handlers ---
+
+def on_join(session_code, player_name):
+    success, message, player_id = join_session(session_code, player_name)
+    
+    if success:
+        session_id = session_code.strip().upper()
+        return (
+            session_id,
+            player_id,
+            _HIDE,  # hide join group
+            _SHOW,  # show game group
+            f"### 👋 Welcome, {player_name.strip() or 'Anonymous'}!",
+            message,
+            format_player_list(session_id, show_submission_status=False),
+            format_scoreboard(session_id),
+            ""
+        )
+    
+    return (
+        None,
+        None,
+        _SHOW,
+        _HIDE,
         "",
-        "### Final Standings:",
+        message,
+        _EMPTY_PLAYER_LIST,
+        _EMPTY_SCOREBOARD,
         ""
-    ]
-    
-    for entry in scoreboard:
-        medal = ""
-        if entry['rank'] == 1:
-            medal = "🥇 "
-        elif entry['rank'] == 2:
-            medal = "🥈 "
-        elif entry['rank'] == 3:
-            medal = "🥉 "
+    )
+
+
+async def on_submit_caption(session_id, player_id, caption):
+    if not session_id or not player_id:
+        return "❌ Not in a game session.", format_player_list(session_id, show_submission_status=True), _EMPTY_SCOREBOARD, "", _NO_CHANGE
+    
+    success, message, all_submitted = submit_caption(session_id, player_id, caption)
+    
+    # If all players submitted, score in the background; the update
+    # streams push the results to everyone when it's done
+    if all_submitted:
+        start_background_scoring(session_id)
+    
+    return (
+        message,
+        format_player_list(session_id, show_submission_status=True),
+        format_scoreboard(session_id),
+        "",
+        _DISABLE if success else _ENABLE  # Disable input after successful submit
+    )
+
+
+def render_player_view(snap: storage.SessionSnapshot, player_id):
+    """Render the player's view of a session snapshot."""
+    session_id = snap.session_id
+    state = get_session_state(session_id)
+    round_num = snap.current_round
+    game_num = snap.current_game
+    total_rounds = snap.total_rounds
+    status = snap.status
+    
+    submitted_count = state.submitted_count if state else 0
+    has_submitted = state.has_submitted(player_id) if state else False
+    
+    if status == 'finished':
+        return (
+            "🚪 **Session ended.** Thanks for playing!",
+            _HIDE,
+            format_player_list(session_id, show_submission_status=False),
+            format_scoreboard(session_id),
+            "",
+            _DISABLE
+        )
+    
+    if status == 'game_over':
+        return (
+            f"🏁 **Game {game_num} Over!** Waiting for host to start new game...",
+            _HIDE,
+            format_player_list(session_id, show_submission_status=False),
+            format_scoreboard(session_id),
+            format_game_over_with_results(session_id),  # Round results, then game over
+            _DISABLE
+        )
+    
+    if status == 'playing':
+        status_text = f"**Round {round_num} of {total_rounds}** | {submitted_count}/{len(snap.players)} submitted"
+        if has_submitted:
+            status_text += " | ✅ You're done!"
         
-        lines.append(f"{medal}**{entry['name']}** — {entry['total_score']} pts")
+        return (
+            status_text,
+            gr.update(value=_round_image_value(state), visible=True) if state and state.current_image_bytes else _HIDE,
+            format_player_list(session_id, show_submission_status=True),
+            _NO_CHANGE,
+            _NO_CHANGE,
+            _DISABLE if has_submitted else _ENABLE
+        )
+    
+    # Lobby status - show results
+    results_md = format_current_round_results(session_id)
+    if round_num > 0:
+        status_text = f"✅ Round {round_num} complete! Waiting for host to start round {round_num + 1}..."
+    else:
+        status_text = f"_Waiting for host to start round 1 of {total_rounds}..._"
+    
+    return (
+        status_text,
+        _HIDE,
+        format_player_list(session_id, show_submission_status=False),
+        format_scoreboard(session_id),
+        results_md,
+        gr.update(value="", interactive=True)
+    )
+
+
+async def on_player_session_updates(session_id, player_id):
+    """Push player UI updates whenever the session changes.
     
-    return "\n".join(lines)
+    Runs until the session ends. Players can still use the Refresh
+    button to re-render manually.
+    """
+    seen_version = -1  # Render once straight away
+    last_sent = [None] * 6
+    while session_id:
+        state = get_session_state(session_id)
+        if not state:
+            return
+        version = await wait_for_session_change(state, seen_version)
+        
+        if version == seen_version:
+            if not storage.session_exists(session_id):
+                return
+            continue  # Keepalive timeout, nothing changed
+        seen_version = version
+        
+        snap = storage.snapshot(session_id)
+        if not snap:
+            return
+        changed = _drop_unchanged(render_player_view(snap, player_id), last_sent)
+        if changed:
+            yield changed
+        if snap.status == 'finished':
+            return
+
+
+def on_refresh(session_id, player_id):
+    """Manual refresh of the player's view."""
+    if not session_id:
+        return (
+            "_Not in a game_",
+            _HIDE,
+            _EMPTY_PLAYER_LIST,
+            _EMPTY_SCOREBOARD,
+            "",
+            _ENABLE
+        )
+    
+    # A burst of clicks re-renders once; the update stream pushes anything newer
+    state = get_session_state(session_id)
+    if state:
+        now = time.monotonic()
+        if now - state.last_manual_refresh.get(player_id, 0.0) < REFRESH_DEBOUNCE:
+            return _NO_REFRESH
+        state.last_manual_refresh[player_id] = now
+    
+    snap = storage.snapshot(session_id)
+    if not snap:
+        return (
+            "_Session not found_",
+            _HIDE,
+            _EMPTY_PLAYER_LIST,
+            _EMPTY_SCOREBOARD,
+            "",
+            _ENABLE
+        )
+    
+    return render_player_view(snap, player_id)
 
 
 # --- Gradio UI ---
@@ -479,16 +1322,19 @@ def build_host_ui():
                     # Player list
                     with gr.Group():
                         gr.Markdown("### 👥 Players")
-                        player_list = gr.Markdown("_No players yet_")
+                        player_list = gr.Dataframe(
+                            value=_EMPTY_PLAYER_LIST, datatype=["str", "str"],
+                            interactive=False, show_label=False, wrap=True
+                        )
                         refresh_players_btn = gr.Button("🔄 Refresh", size="sm")
                     
                     # Scoreboard
                     with gr.Group():
                         gr.Markdown("### 🏆 Scoreboard")
-                        scoreboard_display = gr.Markdown("_Scores appear after first round_")
-            
-            # Auto-refresh timer (every 3 seconds during active session)
-            auto_refresh_timer = gr.Timer(value=3, active=False)
+                        scoreboard_display = gr.Dataframe(
+                            value=_EMPTY_SCOREBOARD, datatype=["str", "str", "number"],
+                            interactive=False, show_label=False, wrap=True
+                        )
             
             # Results section
             with gr.Group():
@@ -506,303 +1352,6 @@ def build_host_ui():
                 reset_btn = gr.Button("🔄 Reset Everything", variant="secondary")
                 end_session_btn = gr.Button("🚪 End Session", variant="stop")
         
-        # --- Event handlers ---
-        
-        def on_create_session(host_name):
-            if not host_name.strip():
-                return (
-                    None, None,
-                    gr.update(visible=True),  # keep create section visible
-                    gr.update(visible=False),  # hide game section
-                    "❌ Please enter your name to start.",
-                    "", "", "", "",
-                    gr.update(visible=False), gr.update(visible=False),
-                    "",
-                    gr.Timer(active=False)  # keep timer inactive
-                )
-            
-            session_id, join_url, host_player_id = create_new_session(host_name)
-            
-            return (
-                session_id,
-                host_player_id,
-                gr.update(visible=False),  # hide create section
-                gr.update(visible=True),   # show game section
-                "",  # clear create status
-                f"### ✅ Session Created!\n\nYou are **{host_name.strip()}** (Host)\n\nShare the code below with players:",
-                session_id,
-                format_scoreboard(session_id),
-                format_player_list(session_id, show_submission_status=False),
-                gr.update(visible=False),  # hide cat image
-                gr.update(visible=False),  # hide game over section
-                "",
-                gr.Timer(active=True)  # activate auto-refresh timer
-            )
-        
-        def on_start_round(session_id, host_player_id):
-            if not session_id:
-                return (
-                    gr.update(), "",
-                    format_player_list(session_id, show_submission_status=True) if session_id else "_No players_",
-                    format_scoreboard(session_id) if session_id else "",
-                    gr.update(visible=False), "",
-                    gr.update(value="", interactive=True),  # clear and enable caption input
-                    "",  # clear caption status
-                    gr.Timer(active=False)
-                )
-
-            success, msg, image = start_round(session_id)
-            if success:
-                session = storage.get_session(session_id)
-                round_num = session['current_round'] if session else 0
-                total_rounds = session['total_rounds'] if session else DEFAULT_ROUNDS
-
-                return (
-                    gr.update(value=image, visible=True),
-                    f"### Round {round_num} of {total_rounds}\n\n{msg}",
-                    format_player_list(session_id, show_submission_status=True),
-                    format_scoreboard(session_id),
-                    gr.update(visible=False),  # hide game over section
-                    "",
-                    gr.update(value="", interactive=True),  # clear and enable caption input
-                    "",  # clear caption status
-                    gr.Timer(active=True)  # REACTIVATE timer for round updates
-                )
-            return (
-                gr.update(visible=False), msg,
-                format_player_list(session_id, show_submission_status=False),
-                format_scoreboard(session_id),
-                gr.update(visible=False), "",
-                gr.update(value="", interactive=True),  # clear caption input
-                "",  # clear caption status
-                gr.Timer(active=False)
-            )
-        
-        def on_host_submit_caption(session_id, host_player_id, caption):
-            if not session_id or not host_player_id:
-                return "❌ No session active.", format_player_list(session_id, show_submission_status=True), "", "", gr.update(), "", gr.Timer(active=False)
-            
-            success, message, all_submitted = submit_caption(session_id, host_player_id, caption)
-            
-            # If all players submitted, auto-score
-            if all_submitted:
-                score_success, score_msg, results, is_game_over = end_round_and_score(session_id)
-                session = storage.get_session(session_id)
-                round_num = session['current_round'] if session else 0
-                
-                if score_success:
-                    if is_game_over:
-                        return (
-                            message,
-                            format_player_list(session_id, show_submission_status=False),
-                            format_round_results(results, round_num),
-                            format_scoreboard(session_id),
-                            gr.update(visible=True),
-                            format_game_over(session_id),
-                            gr.Timer(active=False)  # Stop timer - game over
-                        )
-                    return (
-                        message,
-                        format_player_list(session_id, show_submission_status=False),
-                        format_round_results(results, round_num),
-                        format_scoreboard(session_id),
-                        gr.update(visible=False),
-                        "",
-                        gr.Timer(active=False)  # Stop timer - round ended, waiting for next
-                    )
-            
-            return (
-                message,
-                format_player_list(session_id, show_submission_status=True),
-                "",
-                format_scoreboard(session_id),
-                gr.update(),
-                "",
-                gr.Timer(active=True)  # FIX: Reactivate timer to poll for round completion
-            )
-        
-        def on_end_round(session_id):
-            if not session_id:
-                return (
-                    "❌ No session active.", 
-                    format_player_list(session_id, show_submission_status=False),
-                    "",
-                    format_scoreboard(session_id) if session_id else "",
-                    gr.update(visible=False), ""
-                )
-            
-            session = storage.get_session(session_id)
-            round_num = session['current_round'] if session else 0
-            
-            success, msg, results, is_game_over = end_round_and_score(session_id)
-            
-            if success:
-                if is_game_over:
-                    return (
-                        "🏁 Game finished! See results below.",
-                        format_player_list(session_id, show_submission_status=False),
-                        format_round_results(results, round_num),
-                        format_scoreboard(session_id),
-                        gr.update(visible=True),  # show game over section
-                        format_game_over(session_id)
-                    )
-                
-                return (
-                    f"✅ {msg} Ready for next round.",
-                    format_player_list(session_id, show_submission_status=False),
-                    format_round_results(results, round_num),
-                    format_scoreboard(session_id),
-                    gr.update(visible=False),
-                    ""
-                )
-            
-            return (
-                msg,
-                format_player_list(session_id, show_submission_status=True),
-                "",
-                format_scoreboard(session_id),
-                gr.update(visible=False), ""
-            )
-        
-        def on_new_game(session_id):
-            if not session_id:
-                return "", gr.update(visible=False), "", format_scoreboard(session_id) if session_id else ""
-            
-            success, msg, game_num = start_new_game(session_id)
-            
-            if success:
-                return (
-                    msg,
-                    gr.update(visible=False),  # hide game over section
-                    "",  # clear results
-                    format_scoreboard(session_id)
-                )
-            
-            return msg, gr.update(visible=True), "", format_scoreboard(session_id)
-        
-        def on_refresh_players(session_id):
-            session = storage.get_session(session_id) if session_id else None
-            is_playing = session and session['status'] == 'playing'
-            return format_player_list(session_id, show_submission_status=is_playing)
-        
-        def on_reset_session(session_id):
-            if not session_id:
-                return "❌ No session active.", "", "", "", gr.update(visible=False), ""
-            
-            storage.reset_session(session_id)
-            state = get_session_state(session_id)
-            if state:
-                state.current_image = None
-                state.current_image_url = None
-                state.submissions_this_round = set()
-            
-            return (
-                "✅ Session reset! Players remain, all scores cleared.",
-                format_player_list(session_id, show_submission_status=False),
-                "",
-                format_scoreboard(session_id),
-                gr.update(visible=False),
-                ""
-            )
-        
-        def on_end_session(session_id):
-            if session_id:
-                storage.update_session_status(session_id, 'finished')
-            
-            # Reset UI to initial state
-            return (
-                None,  # clear session_id_state
-                None,  # clear host_player_id_state
-                gr.update(visible=True),   # show create_session_group
-                gr.update(visible=False),  # hide game_section
-                "",  # clear create_status
-                gr.Timer(active=False)  # deactivate timer
-            )
-        
-        def on_auto_refresh(session_id):
-            """Auto-refresh for host - updates player list and checks if all submitted.
-
-            Stops timer in stable states to prevent UI flicker from Gradio's timer tick.
-            """
-            if not session_id:
-                return tuple(gr.update() for _ in range(5)) + (gr.Timer(active=False),)
-
-            session = storage.get_session(session_id)
-            if not session:
-                return tuple(gr.update() for _ in range(5)) + (gr.Timer(active=False),)
-
-            status = session['status']
-
-            # For non-playing states, show results then stop timer
-            if status != 'playing':
-                # Fetch and display results for completed rounds
-                round_num = session['current_round']
-                game_num = session['current_game']
-                results = storage.get_round_captions(session_id, game_num, round_num)
-                results_md = format_round_results(results, round_num) if results else ""
-                
-                if status == 'game_over':
-                    return (
-                        format_player_list(session_id, show_submission_status=False),
-                        format_scoreboard(session_id),
-                        results_md,
-                        gr.update(visible=True),
-                        format_game_over(session_id),
-                        gr.Timer(active=False)
-                    )
-                # lobby status
-                return (
-                    format_player_list(session_id, show_submission_status=False),
-                    format_scoreboard(session_id),
-                    results_md,
-                    gr.update(visible=False),
-                    "",
-                    gr.Timer(active=False)
-                )
-
-            # Check if all submitted and auto-end the round
-            if check_all_submitted(session_id):
-                score_success, score_msg, results, is_game_over = end_round_and_score(session_id)
-                round_num = session['current_round']
-
-                if score_success:
-                    results_md = format_round_results(results, round_num)
-                    if is_game_over:
-                        return (
-                            format_player_list(session_id, show_submission_status=False),
-                            format_scoreboard(session_id),
-                            results_md,
-                            gr.update(visible=True),
-                            format_game_over(session_id),
-                            gr.Timer(active=False)
-                        )
-                    return (
-                        format_player_list(session_id, show_submission_status=False),
-                        format_scoreboard(session_id),
-                        results_md,
-                        gr.update(visible=False),
-                        "",
-                        gr.Timer(active=False)
-                    )
-
-            # Active round - only update player list if changed
-            state = get_session_state(session_id)
-            new_player_list = format_player_list(session_id, show_submission_status=True)
-
-            if state and new_player_list != state.last_player_list_hash:
-                state.last_player_list_hash = new_player_list
-                return (
-                    new_player_list,
-                    gr.update(),
-                    gr.update(),
-                    gr.update(),
-                    gr.update(),
-                    gr.Timer(active=True)
-                )
-            
-            # No changes during playing - stop timer to prevent flicker
-            return tuple(gr.update() for _ in range(5)) + (gr.Timer(active=False),)
-        
         # Connect events
         create_btn.click(
             on_create_session,
@@ -812,16 +1361,15 @@ def build_host_ui():
                 create_session_group, game_section,
                 create_status, session_info, session_code_display,
                 scoreboard_display, player_list,
-                cat_image, game_over_group, game_over_display,
-                auto_refresh_timer
+                cat_image, game_over_group, game_over_display
             ]
-        )
-        
-        # Auto-refresh timer for live updates
-        auto_refresh_timer.tick(
-            on_auto_refresh,
+        ).then(
+            # Live updates, pushed on state changes instead of polled
+            on_host_session_updates,
             inputs=[session_id_state],
-            outputs=[player_list, scoreboard_display, results_display, game_over_group, game_over_display, auto_refresh_timer]
+            outputs=[player_list, scoreboard_display, results_display, game_over_group, game_over_display],
+            concurrency_limit=None,  # Long-lived stream - don't hold a queue slot
+            show_progress="hidden"
         )
         
         start_round_btn.click(
@@ -829,15 +1377,15 @@ def build_host_ui():
             inputs=[session_id_state, host_player_id_state],
             outputs=[
                 cat_image, round_status, player_list, scoreboard_display,
-                game_over_group, game_over_display, host_caption_input, host_caption_status,
-                auto_refresh_timer  # Reactivate timer when round starts
+                game_over_group, game_over_display, host_caption_input, host_caption_status
             ]
         )
         
         host_submit_btn.click(
             on_host_submit_caption,
             inputs=[session_id_state, host_player_id_state, host_caption_input],
-            outputs=[host_caption_status, player_list, results_display, scoreboard_display, game_over_group, game_over_display, auto_refresh_timer]
+            outputs=[host_caption_status, player_list, results_display, scoreboard_display, game_over_group, game_over_display],
+            concurrency_limit=None  # Quick (scoring runs in the background) - never queue behind other events
         )
         
         end_round_btn.click(
@@ -870,7 +1418,7 @@ def build_host_ui():
             outputs=[
                 session_id_state, host_player_id_state,
                 create_session_group, game_section,
-                create_status, auto_refresh_timer
+                create_status
             ]
         )
     
@@ -883,7 +1431,6 @@ def build_player_ui():
     # State
     session_id_state = gr.State(value=None)
     player_id_state = gr.State(value=None)
-    last_status_state = gr.State(value="")  # Track last status to detect changes
     
     with gr.Blocks(title="Cat Caption Cage Match - Player", theme=gr.themes.Soft()) as player_ui:
         gr.Markdown("# 🐱 Cat Caption Cage Match")
@@ -940,306 +1487,49 @@ def build_player_ui():
                     # Player list
                     with gr.Group():
                         gr.Markdown("### 👥 Players")
-                        player_list = gr.Markdown("_No players yet_")
+                        player_list = gr.Dataframe(
+                            value=_EMPTY_PLAYER_LIST, datatype=["str", "str"],
+                            interactive=False, show_label=False, wrap=True
+                        )
                     
                     # Scoreboard
                     with gr.Group():
                         gr.Markdown("### 🏆 Scoreboard")
-                        scoreboard_display = gr.Markdown("_Scores appear after first round_")
-            
-            # Auto-refresh timer (activates after joining, 3 second interval)
-            auto_refresh_timer = gr.Timer(value=3, active=False)
+                        scoreboard_display = gr.Dataframe(
+                            value=_EMPTY_SCOREBOARD, datatype=["str", "str", "number"],
+                            interactive=False, show_label=False, wrap=True
+                        )
             
             # Refresh button (manual backup)
             refresh_btn = gr.Button("🔄 Refresh Game State", size="sm")
         
-        # --- Event handlers ---
-        
-        def on_join(session_code, player_name):
-            success, message, player_id = join_session(session_code, player_name)
-            
-            if success:
-                session_id = session_code.strip().upper()
-                return (
-                    session_id,
-                    player_id,
-                    "",  # initial last_status
-                    gr.update(visible=False),  # hide join group
-                    gr.update(visible=True),   # show game group
-                    f"### 👋 Welcome, {player_name.strip() or 'Anonymous'}!",
-                    message,
-                    format_player_list(session_id, show_submission_status=False),
-                    format_scoreboard(session_id),
-                    "",
-                    gr.Timer(active=True)  # activate auto-refresh
-                )
-            
-            return (
-                None,
-                None,
-                "",
-                gr.update(visible=True),
-                gr.update(visible=False),
-                "",
-                message,
-                "",
-                "",
-                "",
-                gr.Timer(active=False)
-            )
-        
-        def on_submit_caption(session_id, player_id, caption):
-            if not session_id or not player_id:
-                return "❌ Not in a game session.", format_player_list(session_id, show_submission_status=True), "", "", gr.update(), gr.Timer(active=False)
-            
-            success, message, all_submitted = submit_caption(session_id, player_id, caption)
-            
-            # If all players submitted, trigger scoring
-            if all_submitted:
-                score_success, score_msg, results, is_game_over = end_round_and_score(session_id)
-                session = storage.get_session(session_id)
-                round_num = session['current_round'] if session else 0
-                
-                if score_success:
-                    results_md = format_round_results(results, round_num)
-                    if is_game_over:
-                        results_md += "\n\n" + format_game_over(session_id)
-                    return (
-                        "✅ All done! Scoring complete. Check results below!",
-                        format_player_list(session_id, show_submission_status=False),
-                        format_scoreboard(session_id),
-                        results_md,
-                        gr.update(interactive=False),
-                        gr.Timer(active=False)  # Stop timer - round/game ended
-                    )
-            
-            return (
-                message,
-                format_player_list(session_id, show_submission_status=True),
-                format_scoreboard(session_id),
-                "",
-                gr.update(interactive=not success),  # Disable input after successful submit
-                gr.Timer(active=True)  # Reactivate timer to poll for round completion
-            )
-        
-        def on_player_auto_refresh(session_id, player_id, last_status):
-            """Auto-refresh for players - updates when game state changes.
-            
-            Stops timer in stable states to prevent UI flicker from Gradio's timer tick.
-            Players can use the Refresh button to manually check for updates.
-            """
-            if not session_id:
-                return (last_status,) + tuple(gr.update() for _ in range(6)) + (gr.Timer(active=False),)
-            
-            session = storage.get_session(session_id)
-            if not session:
-                return (last_status,) + tuple(gr.update() for _ in range(6)) + (gr.Timer(active=False),)
-            
-            state = get_session_state(session_id)
-            round_num = session['current_round']
-            game_num = session['current_game']
-            total_rounds = session['total_rounds']
-            status = session['status']
-            
-            # Build status key for change detection
-            submitted_count = len(state.submissions_this_round) if state else 0
-            has_submitted = player_id in state.submissions_this_round if state else False
-            current_key = f"{status}|r{round_num}|g{game_num}|s{submitted_count}|h{has_submitted}"
-            
-            # For stable states (lobby, game_over, finished), update once then STOP timer
-            if status in ('lobby', 'game_over', 'finished'):
-                if current_key == last_status:
-                    return (last_status,) + tuple(gr.update() for _ in range(6)) + (gr.Timer(active=False),)
-            
-            # For 'playing' status, also stop timer when nothing changed to prevent flicker
-            if status == 'playing' and current_key == last_status:
-                return (last_status,) + tuple(gr.update() for _ in range(6)) + (gr.Timer(active=False),)
-            
-            # --- State has changed, update UI ---
-            
-            if status == 'finished':
-                return (
-                    current_key,
-                    "🚪 **Session ended.** Thanks for playing!",
-                    gr.update(visible=False),
-                    format_player_list(session_id, show_submission_status=False),
-                    format_scoreboard(session_id),
-                    "",
-                    gr.update(interactive=False),
-                    gr.Timer(active=False)  # Stop timer - session ended
-                )
-            
-            if status == 'game_over':
-                # Include round results before game over display
-                results = storage.get_round_captions(session_id, game_num, round_num)
-                results_md = format_round_results(results, round_num) if results else ""
-                game_over_md = format_game_over(session_id)
-                combined_md = results_md + "\n\n" + game_over_md if results_md else game_over_md
-                return (
-                    current_key,
-                    f"🏁 **Game {game_num} Over!** Waiting for host to start new game...",
-                    gr.update(visible=False),
-                    format_player_list(session_id, show_submission_status=False),
-                    format_scoreboard(session_id),
-                    combined_md,
-                    gr.update(interactive=False),
-                    gr.Timer(active=False)  # Stop timer - will restart when new game begins
-                )
-            
-            if status == 'playing':
-                players = storage.get_players(session_id)
-                status_text = f"**Round {round_num} of {total_rounds}** | {submitted_count}/{len(players)} submitted"
-                if has_submitted:
-                    status_text += " | ✅ You're done!"
-                
-                return (
-                    current_key,
-                    status_text,
-                    gr.update(value=state.current_image, visible=True) if state and state.current_image else gr.update(visible=False),
-                    format_player_list(session_id, show_submission_status=True),
-                    gr.update(),
-                    gr.update(),
-                    gr.update(interactive=not has_submitted),
-                    gr.Timer(active=True)  # Keep timer active during play
-                )
-            
-            # Lobby status - show results then stop timer
-            results_md = ""
-            if round_num > 0:
-                last_results = storage.get_round_captions(session_id, game_num, round_num)
-                if last_results:
-                    results_md = format_round_results(last_results, round_num)
-            
-            return (
-                current_key,
-                f"✅ Round {round_num} complete! Waiting for host to start round {round_num + 1}...",
-                gr.update(visible=False),
-                format_player_list(session_id, show_submission_status=False),
-                format_scoreboard(session_id),
-                results_md,
-                gr.update(value="", interactive=True),
-                gr.Timer(active=False)  # Stop timer in lobby - will restart when round begins
-            )
-        
-        def on_refresh(session_id, player_id):
-            """Manual refresh - also reactivates timer if game is playing."""
-            if not session_id:
-                return (
-                    "_Not in a game_",
-                    gr.update(visible=False),
-                    "_No players_",
-                    "_No scores yet_",
-                    "",
-                    gr.update(interactive=True),
-                    gr.Timer(active=False)
-                )
-            
-            session = storage.get_session(session_id)
-            if not session:
-                return (
-                    "_Session not found_",
-                    gr.update(visible=False),
-                    "_No players_",
-                    "_No scores yet_",
-                    "",
-                    gr.update(interactive=True),
-                    gr.Timer(active=False)
-                )
-            
-            state = get_session_state(session_id)
-            round_num = session['current_round']
-            game_num = session['current_game']
-            total_rounds = session['total_rounds']
-            
-            # Determine status and image
-            if session['status'] == 'finished':
-                return (
-                    "🚪 **Session ended.** Thanks for playing!",
-                    gr.update(visible=False),
-                    format_player_list(session_id, show_submission_status=False),
-                    format_scoreboard(session_id),
-                    "",
-                    gr.update(interactive=False),
-                    gr.Timer(active=False)
-                )
-            
-            if session['status'] == 'game_over':
-                return (
-                    f"🏁 **Game {game_num} Over!** Waiting for host to start new game...",
-                    gr.update(visible=False),
-                    format_player_list(session_id, show_submission_status=False),
-                    format_game_over(session_id),
-                    "",
-                    gr.update(interactive=False),
-                    gr.Timer(active=False)
-                )
-            
-            if session['status'] == 'playing':
-                # Show current round - REACTIVATE timer for live updates
-                has_submitted = player_id in state.submissions_this_round if state else False
-                players = storage.get_players(session_id)
-                submitted_count = len(state.submissions_this_round) if state else 0
-                
-                status_text = f"**Round {round_num} of {total_rounds}** | {submitted_count}/{len(players)} submitted"
-                if has_submitted:
-                    status_text += " | ✅ You're done!"
-                
-                return (
-                    status_text,
-                    gr.update(value=state.current_image, visible=True) if state and state.current_image else gr.update(visible=False),
-                    format_player_list(session_id, show_submission_status=True),
-                    format_scoreboard(session_id),
-                    "",
-                    gr.update(interactive=not has_submitted),
-                    gr.Timer(active=True)  # Reactivate timer during play
-                )
-            
-            # Lobby status (between rounds) - clear caption for next round
-            results_md = ""
-            if round_num > 0:
-                last_results = storage.get_round_captions(session_id, game_num, round_num)
-                if last_results:
-                    results_md = format_round_results(last_results, round_num)
-            
-            return (
-                f"_Waiting for host to start round {round_num + 1} of {total_rounds}..._",
-                gr.update(visible=False),
-                format_player_list(session_id, show_submission_status=False),
-                format_scoreboard(session_id),
-                results_md,
-                gr.update(value="", interactive=True),
-                gr.Timer(active=False)  # Timer off in lobby
-            )
-        
         # Connect events
         join_btn.click(
             on_join,
             inputs=[session_code_input, player_name_input],
             outputs=[
-                session_id_state, player_id_state, last_status_state,
+                session_id_state, player_id_state,
                 join_group, game_group,
                 player_welcome, join_status,
-                player_list, scoreboard_display, results_display,
-                auto_refresh_timer
+                player_list, scoreboard_display, results_display
             ]
-        )
-        
-        # Auto-refresh timer for live updates
-        auto_refresh_timer.tick(
-            on_player_auto_refresh,
-            inputs=[session_id_state, player_id_state, last_status_state],
+        ).then(
+            # Live updates, pushed on state changes instead of polled
+            on_player_session_updates,
+            inputs=[session_id_state, player_id_state],
             outputs=[
-                last_status_state,
                 game_status, cat_image, player_list,
-                scoreboard_display, results_display, caption_input,
-                auto_refresh_timer  # Allow function to control timer active state
-            ]
+                scoreboard_display, results_display, caption_input
+            ],
+            concurrency_limit=None,  # Long-lived stream - don't hold a queue slot
+            show_progress="hidden"
         )
         
         submit_btn.click(
             on_submit_caption,
             inputs=[session_id_state, player_id_state, caption_input],
-            outputs=[caption_status, player_list, scoreboard_display, results_display, caption_input, auto_refresh_timer]
+            outputs=[caption_status, player_list, scoreboard_display, results_display, caption_input],
+            concurrency_limit=None  # Quick (scoring runs in the background) - never queue behind other events
         )
         
         refresh_btn.click(
@@ -1247,8 +1537,7 @@ def build_player_ui():
             inputs=[session_id_state, player_id_state],
             outputs=[
                 game_status, cat_image, player_list,
-                scoreboard_display, results_display, caption_input,
-                auto_refresh_timer  # Allow refresh to reactivate timer
+                scoreboard_display, results_display, caption_input
             ]
         )
     
@@ -1409,6 +1698,9 @@ def build_app():
         *Cat Caption Cage Match — Built for fun, powered by cats and AI* 🐈‍⬛
         """)
     
+    # Let many sessions' events run at once instead of one at a time per handler
+    app.queue(default_concurrency_limit=QUEUE_CONCURRENCY, max_size=QUEUE_MAX_SIZE, api_open=False)
+    
     return app
 
 
@@ -1429,9 +1721,19 @@ def main():
         print(f"⚠️  LLM API: {api_msg}")
         print("   Game will use fake scoring mode.")
     
+    # Warn if JPEG decode/encode is not SIMD-accelerated
+    if not images.has_libjpeg_turbo():
+        print("⚠️  Pillow is not built with libjpeg-turbo - image handling will be slower.")
+        print("   Reinstall Pillow from an official wheel or build it against libjpeg-turbo.")
+    
     # Ensure local cats directory exists
     images.ensure_local_cats_dir()
     
+    # Serve round images straight from disk rather than copying them into
+    # Gradio's cache for every viewer
+    images.ROUND_IMAGES_DIR.mkdir(parents=True, exist_ok=True)
+    gr.set_static_paths(paths=[images.ROUND_IMAGES_DIR])
+    
     # Build and launch the app
     app = build_app()
     
@@ -1442,7 +1744,8 @@ def main():
         share=True,  # Creates a public URL for easy sharing
         server_name="0.0.0.0",
         server_port=None,  # Auto-find available port
-        show_error=True
+        show_error=True,
+        max_threads=MAX_THREADS
     )
 
 
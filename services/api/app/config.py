@@ -28,6 +28,10 @@ class Settings(BaseSettings):
     llm_provider: Literal["groq", "gemini", "fake"] = "fake"
     groq_api_key: str = ""
     gemini_api_key: str = ""
+    # Provider request limits, shared by all sessions. Size llm_rpm_limit to
+    # the API tier (0 disables it) so bursts wait instead of failing with 429s.
+    llm_max_concurrency: int = 4
+    llm_rpm_limit: int = 30
     
     # TheCatAPI
     thecatapi_key: str = ""
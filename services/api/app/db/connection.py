@@ -7,6 +7,7 @@ Supports both SQLite (dev) and PostgreSQL (production).
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -22,6 +23,17 @@ from .models import Base
 _engine: AsyncEngine | None = None
 _session_factory: async_sessionmaker[AsyncSession] | None = None
 
+# Applied to every new SQLite connection. WAL lets readers run alongside a
+# writer and NORMAL sync skips the fsync per commit (still safe in WAL mode);
+# the rest keep hot pages in memory (256MB mmap, 64MB page cache).
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+)
+
 
 def get_db_engine() -> AsyncEngine:
     """Get or create the database engine."""
@@ -39,10 +51,21 @@ def get_db_engine() -> AsyncEngine:
             # SQLite needs special handling for async
             connect_args={"check_same_thread": False} if is_sqlite else {},
         )
+        
+        if is_sqlite:
+            event.listen(_engine.sync_engine, "connect", _set_sqlite_pragmas)
     
     return _engine
 
 
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Apply SQLITE_PRAGMAS to a freshly opened SQLite connection."""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
     """Get or create the session factory."""
     global _session_factory
@@ -14,6 +14,8 @@ from sqlalchemy import (
     String,
     Text,
     JSON,
+    UniqueConstraint,
+    func,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
@@ -36,7 +38,7 @@ class SessionModel(Base):
     settings: Mapped[dict] = mapped_column(JSON, default=dict)
     
     current_round: Mapped[int] = mapped_column(Integer, default=0)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     expires_at: Mapped[datetime] = mapped_column(DateTime)
     
     # Relationships
@@ -58,7 +60,7 @@ class PlayerModel(Base):
     )
     display_name: Mapped[str] = mapped_column(String(50))
     is_host: Mapped[bool] = mapped_column(Boolean, default=False)
-    joined_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    joined_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     
     # Relationships
     session: Mapped["SessionModel"] = relationship("SessionModel", back_populates="players")
@@ -91,6 +93,13 @@ class RoundModel(Base):
 class CaptionModel(Base):
     """A player's caption submission for a round."""
     __tablename__ = "captions"
+    # One caption per player per round, enforced by the database; the
+    # constraint's index also serves the "has this player submitted?" lookup.
+    # It leads with round_id, so player_id keeps its own index for lookups
+    # by player alone (and the players.id cascade delete).
+    __table_args__ = (
+        UniqueConstraint("round_id", "player_id", name="uq_caption_round_player"),
+    )
     
     id: Mapped[str] = mapped_column(String(100), primary_key=True)
     round_id: Mapped[str] = mapped_column(
@@ -100,7 +109,7 @@ class CaptionModel(Base):
         String(100), ForeignKey("players.id", ondelete="CASCADE"), index=True
     )
     text: Mapped[str] = mapped_column(Text)
-    submitted_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    submitted_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now())
     
     # Score fields (nullable until scored)
     score_humour: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
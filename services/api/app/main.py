@@ -3,18 +3,28 @@ Cat Caption Cage Match - FastAPI Backend
 
 Main application entry point with REST API and Socket.IO.
 """
+import importlib.util
 import socketio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from .config import get_settings
 from .routers import health_router, sessions_router
 from .socket_manager import sio, configure_cors
 from .tasks import cleanup_task
+from .services.images import close_http_client
 from . import __version__
 
+# Serialize responses with orjson when it's installed (much faster on the
+# session-state and leaderboard payloads); stdlib json is the fallback
+if importlib.util.find_spec("orjson") is not None:
+    DEFAULT_RESPONSE_CLASS = ORJSONResponse
+else:
+    DEFAULT_RESPONSE_CLASS = JSONResponse
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -45,6 +55,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     print("Shutting down...")
     cleanup_task.stop()
+    await close_http_client()
     if settings.storage_type == "sql":
         from .db.connection import close_db
         await close_db()
@@ -57,6 +68,7 @@ app = FastAPI(
     description="Backend API for the AI-powered cat caption party game",
     version=__version__,
     lifespan=lifespan,
+    default_response_class=DEFAULT_RESPONSE_CLASS,
 )
 
 # Configure CORS
@@ -28,7 +28,7 @@ from ..models import (
 from ..storage import Storage
 from ..dependencies import get_storage, get_current_player_id, require_host
 from ..services.tokens import create_player_token
-from ..services.images import fetch_random_cat_url
+from ..services.images import next_cat_url
 from ..services.llm import score_captions
 from ..socket_manager import (
     broadcast_session_state,
@@ -104,23 +104,14 @@ async def get_session_state(
     """Get the current state of a session."""
     session_code = session_code.upper()
     
-    session = await storage.get_session(session_code)
-    if not session:
+    state = await storage.get_session_state(session_code)
+    if not state:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={"code": "NOT_FOUND", "message": f"Session '{session_code}' not found"},
         )
     
-    players = await storage.get_players(session_code)
-    current_round = await storage.get_current_round(session_code)
-    leaderboard = await storage.get_leaderboard(session_code)
-    
-    return SessionStateResponse(
-        session=session,
-        players=players,
-        current_round=current_round,
-        leaderboard=leaderboard,
-    )
+    return state
 
 
 @router.post(
@@ -238,8 +229,8 @@ async def start_round(
     # Increment round counter
     round_number = await storage.increment_session_round(session_code)
     
-    # Fetch cat image
-    image_url = await fetch_random_cat_url()
+    # Fetch cat image (prefetched while the previous round was played)
+    image_url = await next_cat_url()
     
     now = datetime.now(timezone.utc)
     
@@ -412,14 +403,7 @@ async def submit_caption(
             detail={"code": "VALIDATION", "message": "Caption exceeds 15 word limit"},
         )
     
-    # Check if already submitted
-    if await storage.has_submitted(session_code, round_id, player_id):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={"code": "VALIDATION", "message": "Already submitted for this round"},
-        )
-    
-    # Submit caption
+    # Submit caption (storage rejects a second caption for the round)
     caption_id = generate_id("caption_")
     caption = await storage.submit_caption(
         session_code=session_code,
@@ -432,7 +416,7 @@ async def submit_caption(
     if not caption:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail={"code": "VALIDATION", "message": "Failed to submit caption"},
+            detail={"code": "VALIDATION", "message": "Already submitted for this round"},
         )
     
     # Broadcast that this player has submitted
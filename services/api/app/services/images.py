@@ -3,6 +3,7 @@ Cat image fetching service.
 
 Fetches random cat images from TheCatAPI with fallbacks.
 """
+import asyncio
 import os
 import random
 from pathlib import Path
@@ -15,6 +16,13 @@ from ..config import get_settings
 # TheCatAPI endpoint
 CAT_API_URL = "https://api.thecatapi.com/v1/images/search"
 
+# Shared HTTP client (created on first use) so TheCatAPI and image downloads
+# reuse pooled keep-alive connections instead of a fresh TLS handshake per call
+_http_client: httpx.AsyncClient | None = None
+
+# Cat URL fetched ahead of the next round (see next_cat_url)
+_next_cat_task: asyncio.Task | None = None
+
 # Fallback placeholder images (when API is unavailable)
 PLACEHOLDER_CATS = [
     "https://placekitten.com/600/400",
@@ -24,6 +32,32 @@ PLACEHOLDER_CATS = [
 ]
 
 
+def get_http_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client."""
+    global _http_client
+    
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+        )
+    
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """
+    Close the shared HTTP client.
+    
+    Call this on application shutdown.
+    """
+    global _http_client
+    
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
 async def fetch_random_cat_url() -> str:
     """
     Fetch a random cat image URL.
@@ -33,25 +67,24 @@ async def fetch_random_cat_url() -> str:
     settings = get_settings()
     
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            headers = {}
-            if settings.thecatapi_key:
-                headers["x-api-key"] = settings.thecatapi_key
-            
-            response = await client.get(
-                CAT_API_URL,
-                headers=headers,
-                params={
-                    "size": "med",
-                    "mime_types": "jpg,png",
-                    "limit": 1,
-                },
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            if data and len(data) > 0:
-                return data[0]["url"]
+        headers = {}
+        if settings.thecatapi_key:
+            headers["x-api-key"] = settings.thecatapi_key
+        
+        response = await get_http_client().get(
+            CAT_API_URL,
+            headers=headers,
+            params={
+                "size": "med",
+                "mime_types": "jpg,png",
+                "limit": 1,
+            },
+        )
+        response.raise_for_status()
+        
+        data = response.json()
+        if data and len(data) > 0:
+            return data[0]["url"]
     
     except Exception as e:
         print(f"TheCatAPI error: {e}")
@@ -60,14 +93,29 @@ async def fetch_random_cat_url() -> str:
     return random.choice(PLACEHOLDER_CATS)
 
 
+async def next_cat_url() -> str:
+    """
+    Get a cat image URL for a new round.
+    
+    Uses the URL prefetched by the previous call (waiting for it if still
+    in flight) and starts fetching the next one, so TheCatAPI's latency
+    overlaps with players writing captions instead of delaying round start.
+    """
+    global _next_cat_task
+    
+    task, _next_cat_task = _next_cat_task, None
+    url = await task if task is not None else await fetch_random_cat_url()
+    _next_cat_task = asyncio.create_task(fetch_random_cat_url())
+    return url
+
+
 async def fetch_cat_image_bytes(url: str) -> bytes:
     """
     Fetch image bytes from a URL.
     
     Useful if you need the actual image data (e.g., for LLM vision).
     """
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        response = await client.get(url)
-        response.raise_for_status()
-        return response.content
+    response = await get_http_client().get(url, timeout=15.0)
+    response.raise_for_status()
+    return response.content
 
@@ -3,33 +3,72 @@ LLM scoring service for caption judging.
 
 Supports Groq (preferred) and Gemini as providers, with a fake mode for testing.
 """
+import asyncio
 import json
 import hashlib
 import os
+import time
 from typing import Optional
 
 from ..config import get_settings
 
-# Try to import LLM clients
+# Try to import orjson (faster JSON parsing; stdlib json is the fallback)
 try:
-    from groq import Groq
-    GROQ_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    GROQ_AVAILABLE = False
-    Groq = None
-
-try:
-    import google.generativeai as genai
-    GENAI_AVAILABLE = True
-except ImportError:
-    GENAI_AVAILABLE = False
-    genai = None
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+# LLM SDKs are imported lazily on first use: google.generativeai in particular
+# drags in protobuf/grpc at import time, which fake mode never needs.
+# *_AVAILABLE is None until the first import attempt.
+Groq = None
+GROQ_AVAILABLE: Optional[bool] = None
+
+genai = None
+GENAI_AVAILABLE: Optional[bool] = None
+
+
+def _load_groq() -> bool:
+    """Import the Groq SDK on first use. Returns True if available."""
+    global Groq, GROQ_AVAILABLE
+    if GROQ_AVAILABLE is None:
+        try:
+            from groq import Groq as _Groq
+            Groq = _Groq
+            GROQ_AVAILABLE = True
+        except ImportError:
+            GROQ_AVAILABLE = False
+    return GROQ_AVAILABLE
+
+
+def _load_genai() -> bool:
+    """Import the Google Generative AI SDK on first use. Returns True if available."""
+    global genai, GENAI_AVAILABLE
+    if GENAI_AVAILABLE is None:
+        try:
+            import google.generativeai as _genai
+            genai = _genai
+            GENAI_AVAILABLE = True
+        except ImportError:
+            GENAI_AVAILABLE = False
+    return GENAI_AVAILABLE
 
 
 # Model configuration
 GROQ_MODEL = "llama-3.3-70b-versatile"
 GEMINI_MODEL = "gemini-1.5-flash"
 
+# Max captions per LLM request - larger rounds are split into batches
+# that are scored concurrently
+LLM_BATCH_SIZE = 20
+
+# In-flight and per-minute request limits across all sessions, sized from
+# settings.llm_max_concurrency / settings.llm_rpm_limit on first use
+_llm_semaphore: Optional[asyncio.Semaphore] = None
+_llm_rate_limiter: Optional["_RateLimiter"] = None
+
 # Cached clients
 _groq_client = None
 _gemini_model = None
@@ -38,7 +77,7 @@ _gemini_model = None
 def _get_groq_client():
     """Get or create Groq client."""
     global _groq_client
-    if _groq_client is None and GROQ_AVAILABLE:
+    if _groq_client is None and _load_groq():
         settings = get_settings()
         if settings.groq_api_key:
             _groq_client = Groq(api_key=settings.groq_api_key)
@@ -48,7 +87,7 @@ def _get_groq_client():
 def _get_gemini_model():
     """Get or create Gemini model."""
     global _gemini_model
-    if _gemini_model is None and GENAI_AVAILABLE:
+    if _gemini_model is None and _load_genai():
         settings = get_settings()
         if settings.gemini_api_key:
             genai.configure(api_key=settings.gemini_api_key)
@@ -58,10 +97,10 @@ def _get_gemini_model():
 
 def _build_prompt(captions: list[dict]) -> str:
     """Build the scoring prompt."""
-    caption_list = "\n".join([
-        f'{i+1}. Player: "{c["player_name"]}" - Caption: "{c["caption"]}"'
-        for i, c in enumerate(captions)
-    ])
+    caption_list = "\n".join(
+        f'{i}. Player: "{c["player_name"]}" - Caption: "{c["caption"]}"'
+        for i, c in enumerate(captions, 1)
+    )
     
     return f"""You are "Cat Meme Gordon Ramsay" - a brutally honest but hilarious judge of cat meme captions.
 
@@ -104,7 +143,7 @@ def _parse_response(response_text: str) -> list[dict]:
         text = text[:-3]
     text = text.strip()
     
-    data = json.loads(text)
+    data = orjson.loads(text) if ORJSON_AVAILABLE else json.loads(text)
     results = data.get("results", [])
     
     # Validate and clean
@@ -270,6 +309,11 @@ async def score_captions(
     """
     Score captions using LLM.
     
+    Rounds of up to LLM_BATCH_SIZE captions are scored in one request;
+    larger rounds are split into batches scored concurrently (bounded by
+    the llm_max_concurrency and llm_rpm_limit settings). Provider SDK calls are blocking, so they run in
+    worker threads to keep the event loop free for other sessions.
+    
     Args:
         image_url: URL of the cat image
         captions: List of {"player_id": str, "player_name": str, "caption": str}
@@ -291,35 +335,112 @@ async def score_captions(
     if settings.llm_provider == "fake":
         return _fake_score(captions)
     
+    batches = [
+        captions[i:i + LLM_BATCH_SIZE]
+        for i in range(0, len(captions), LLM_BATCH_SIZE)
+    ]
+    semaphore = _get_llm_semaphore()
+    rate_limiter = _get_llm_rate_limiter()
+    
+    async def _score_batch(batch: list[dict]) -> list[dict]:
+        if rate_limiter:
+            await rate_limiter.acquire()
+        async with semaphore:
+            return await asyncio.to_thread(_score_batch_sync, settings.llm_provider, batch)
+    
+    # gather keeps batch order, so results line up with the captions
+    batch_results = await asyncio.gather(
+        *(_score_batch(batch) for batch in batches), return_exceptions=True
+    )
+    
+    results = []
+    for batch, batch_result in zip(batches, batch_results):
+        if isinstance(batch_result, BaseException):
+            print(f"LLM scoring error: {batch_result}")
+            batch_result = None
+        # Fallback to fake scoring (has access to player_id)
+        results.extend(batch_result or _fake_score(batch))
+    return results
+
+
+def _get_llm_semaphore() -> asyncio.Semaphore:
+    """Get or create the semaphore bounding concurrent LLM requests."""
+    global _llm_semaphore
+    if _llm_semaphore is None:
+        _llm_semaphore = asyncio.Semaphore(max(1, get_settings().llm_max_concurrency))
+    return _llm_semaphore
+
+
+class _RateLimiter:
+    """
+    Token bucket allowing `rate` requests per `period` seconds.
+    
+    The bucket starts full, so a quiet server can send a burst of up to
+    `rate` requests at once; after that, requests are spaced out at the
+    refill rate. Waiters queue on the lock, so they are served in order.
+    """
+    
+    def __init__(self, rate: int, period: float = 60.0):
+        self.capacity = float(rate)
+        self.refill_per_second = rate / period
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.refill_per_second)
+        self.updated_at = now
+    
+    async def acquire(self) -> None:
+        """Wait until a request may be sent, then take its token."""
+        async with self._lock:
+            self._refill()
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.refill_per_second)
+                self._refill()
+            self.tokens -= 1
+
+
+def _get_llm_rate_limiter() -> Optional[_RateLimiter]:
+    """Get or create the provider rate limiter. None if llm_rpm_limit is 0."""
+    global _llm_rate_limiter
+    if _llm_rate_limiter is None:
+        rpm_limit = get_settings().llm_rpm_limit
+        if rpm_limit > 0:
+            _llm_rate_limiter = _RateLimiter(rpm_limit)
+    return _llm_rate_limiter
+
+
+def _score_batch_sync(provider: str, captions: list[dict]) -> Optional[list[dict]]:
+    """
+    Score one batch of captions with the provider in a single request.
+    Returns None if the provider isn't configured; raises on request errors.
+    """
     prompt = _build_prompt(captions)
     
-    try:
-        if settings.llm_provider == "groq":
-            client = _get_groq_client()
-            if client:
-                response = client.chat.completions.create(
-                    model=GROQ_MODEL,
-                    messages=[{"role": "user", "content": prompt}],
-                    max_tokens=1024,
-                    temperature=0.7,
-                )
-                results = _parse_response(response.choices[0].message.content)
-                # Merge player_id back into results
-                return _merge_player_ids(results, captions)
-        
-        elif settings.llm_provider == "gemini":
-            model = _get_gemini_model()
-            if model:
-                response = model.generate_content(prompt)
-                results = _parse_response(response.text)
-                # Merge player_id back into results
-                return _merge_player_ids(results, captions)
+    if provider == "groq":
+        client = _get_groq_client()
+        if client:
+            response = client.chat.completions.create(
+                model=GROQ_MODEL,
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=max(1024, 96 * len(captions)),
+                temperature=0.7,
+            )
+            results = _parse_response(response.choices[0].message.content)
+            # Merge player_id back into results
+            return _merge_player_ids(results, captions)
     
-    except Exception as e:
-        print(f"LLM scoring error: {e}")
+    elif provider == "gemini":
+        model = _get_gemini_model()
+        if model:
+            response = model.generate_content(prompt)
+            results = _parse_response(response.text)
+            # Merge player_id back into results
+            return _merge_player_ids(results, captions)
     
-    # Fallback to fake scoring (has access to player_id)
-    return _fake_score(captions)
+    return None
 
 
 async def test_llm_connection() -> tuple[bool, str]:
@@ -8,6 +8,7 @@ import hmac
 import hashlib
 import base64
 import time
+from collections import OrderedDict
 from typing import Optional
 
 from ..config import get_settings
@@ -16,6 +17,14 @@ from ..config import get_settings
 # Token expiry: 24 hours
 TOKEN_EXPIRY_SECONDS = 24 * 60 * 60
 
+# Verified tokens: (token, session_code) -> (player_id, cached_until).
+# Clients send the same token on every request and socket event, so a hit
+# skips the decode and HMAC. Only valid tokens are cached, for at most
+# VERIFIED_TOKEN_TTL and never past the token's own expiry.
+VERIFIED_TOKEN_TTL = 60
+VERIFIED_TOKEN_CACHE_SIZE = 10_000
+_verified_tokens: OrderedDict[tuple[str, str], tuple[str, float]] = OrderedDict()
+
 
 def create_player_token(player_id: str, session_code: str) -> str:
     """
@@ -51,6 +60,26 @@ def verify_player_token(token: str, expected_session_code: str) -> Optional[str]
     - Token is expired
     - Session code doesn't match
     """
+    key = (token, expected_session_code.upper())
+    now = time.time()
+    cached = _verified_tokens.get(key)
+    if cached is not None:
+        player_id, cached_until = cached
+        if now < cached_until:
+            _verified_tokens.move_to_end(key)
+            return player_id
+        del _verified_tokens[key]
+    
+    player_id, expires_at = _verify_token(token, expected_session_code)
+    if player_id:
+        _verified_tokens[key] = (player_id, min(now + VERIFIED_TOKEN_TTL, expires_at))
+        if len(_verified_tokens) > VERIFIED_TOKEN_CACHE_SIZE:
+            _verified_tokens.popitem(last=False)
+    return player_id
+
+
+def _verify_token(token: str, expected_session_code: str) -> tuple[Optional[str], float]:
+    """Decode and check a token. Returns (player_id, expires_at) or (None, 0)."""
     settings = get_settings()
     
     try:
@@ -59,18 +88,18 @@ def verify_player_token(token: str, expected_session_code: str) -> Optional[str]
         parts = token_data.split(":")
         
         if len(parts) != 4:
-            return None
+            return None, 0.0
         
         player_id, session_code, timestamp, provided_signature = parts
         
         # Check session code matches
         if session_code.upper() != expected_session_code.upper():
-            return None
+            return None, 0.0
         
         # Check expiry
-        token_time = int(timestamp)
-        if time.time() - token_time > TOKEN_EXPIRY_SECONDS:
-            return None
+        expires_at = int(timestamp) + TOKEN_EXPIRY_SECONDS
+        if time.time() > expires_at:
+            return None, 0.0
         
         # Verify signature
         payload = f"{player_id}:{session_code}:{timestamp}"
@@ -81,10 +110,10 @@ def verify_player_token(token: str, expected_session_code: str) -> Optional[str]
         ).hexdigest()[:16]
         
         if not hmac.compare_digest(provided_signature, expected_signature):
-            return None
+            return None, 0.0
         
-        return player_id
+        return player_id, expires_at
         
     except Exception:
-        return None
+        return None, 0.0
 
@@ -85,23 +85,14 @@ async def session_join(sid: str, data: dict):
     
     # Get current state
     storage = get_storage()
-    session = await storage.get_session(session_code)
+    state = await storage.get_session_state(session_code)
     
-    if not session:
+    if not state:
         return {"ok": False, "error": f"Session '{session_code}' not found"}
     
-    players = await storage.get_players(session_code)
-    current_round = await storage.get_current_round(session_code)
-    leaderboard = await storage.get_leaderboard(session_code)
-    
     return {
         "ok": True,
-        "state": {
-            "session": session.model_dump(mode="json", by_alias=True),
-            "players": [p.model_dump(mode="json", by_alias=True) for p in players],
-            "currentRound": current_round.model_dump(mode="json", by_alias=True) if current_round else None,
-            "leaderboard": [e.model_dump(mode="json", by_alias=True) for e in leaderboard],
-        },
+        "state": state.model_dump(mode="json", by_alias=True),
     }
 
 
@@ -152,23 +143,14 @@ async def broadcast_session_state(session_code: str) -> None:
     """Broadcast updated session state to all clients in the room."""
     storage = get_storage()
     
-    session = await storage.get_session(session_code)
-    if not session:
+    state = await storage.get_session_state(session_code)
+    if not state:
         return
     
-    players = await storage.get_players(session_code)
-    current_round = await storage.get_current_round(session_code)
-    leaderboard = await storage.get_leaderboard(session_code)
-    
     room = f"session:{session_code}"
     await sio.emit(
         "session:state",
-        {
-            "session": session.model_dump(mode="json", by_alias=True),
-            "players": [p.model_dump(mode="json", by_alias=True) for p in players],
-            "currentRound": current_round.model_dump(mode="json", by_alias=True) if current_round else None,
-            "leaderboard": [e.model_dump(mode="json", by_alias=True) for e in leaderboard],
-        },
+        state.model_dump(mode="json", by_alias=True),
         room=room,
     )
 
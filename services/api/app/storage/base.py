@@ -8,7 +8,8 @@ from datetime import datetime
 from typing import Optional
 
 from ..models import (
-    Session, SessionSettings, Player, Round, Caption, Score, LeaderboardEntry
+    Session, SessionSettings, Player, Round, Caption, Score, LeaderboardEntry,
+    SessionStateResponse,
 )
 
 
@@ -52,6 +53,21 @@ class Storage(ABC):
         """Check if a session with this code exists."""
         pass
     
+    async def get_session_state(self, session_code: str) -> Optional[SessionStateResponse]:
+        """
+        Get the full session view (session, players, current round, leaderboard).
+        Returns None if not found. Backends can override this to load it in one go.
+        """
+        session = await self.get_session(session_code)
+        if not session:
+            return None
+        return SessionStateResponse(
+            session=session,
+            players=await self.get_players(session_code),
+            current_round=await self.get_current_round(session_code),
+            leaderboard=await self.get_leaderboard(session_code),
+        )
+    
     # ========================================================================
     # Player Management
     # ========================================================================
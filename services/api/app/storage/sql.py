@@ -7,10 +7,13 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from sqlalchemy import select, delete, func
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from ..models import (
-    Session, SessionSettings, Player, Round, Caption, Score, LeaderboardEntry
+    Session, SessionSettings, Player, Round, Caption, Score, LeaderboardEntry,
+    SessionStateResponse,
 )
 from ..db.models import SessionModel, PlayerModel, RoundModel, CaptionModel
 from ..db.connection import get_db_session_context
@@ -169,6 +172,27 @@ class SQLStorage(Storage):
                 return self._session_model_to_pydantic(model)
             return None
     
+    async def get_session_state(self, session_code: str) -> Optional[SessionStateResponse]:
+        # One DB session for the whole view, with the players loaded alongside
+        # the session row instead of each part re-resolving the session code
+        async with get_db_session_context() as db:
+            result = await db.execute(
+                select(SessionModel)
+                .where(SessionModel.code == session_code)
+                .options(selectinload(SessionModel.players))
+            )
+            model = result.scalar_one_or_none()
+            if not model:
+                return None
+            
+            players = sorted(model.players, key=lambda p: (not p.is_host, p.joined_at))
+            return SessionStateResponse(
+                session=self._session_model_to_pydantic(model),
+                players=[self._player_model_to_pydantic(p) for p in players],
+                current_round=await self._get_current_round(db, model.id),
+                leaderboard=await self._get_leaderboard(db, model.id),
+            )
+    
     async def session_exists(self, session_code: str) -> bool:
         async with get_db_session_context() as db:
             result = await db.execute(
@@ -274,20 +298,22 @@ class SQLStorage(Storage):
             session_id = await self._get_session_id_from_code(db, session_code)
             if not session_id:
                 return None
-            
-            result = await db.execute(
-                select(RoundModel)
-                .where(
-                    RoundModel.session_id == session_id,
-                    RoundModel.status == "active",
-                )
-                .order_by(RoundModel.number.desc())
-                .limit(1)
+            return await self._get_current_round(db, session_id)
+    
+    async def _get_current_round(self, db: AsyncSession, session_id: str) -> Optional[Round]:
+        result = await db.execute(
+            select(RoundModel)
+            .where(
+                RoundModel.session_id == session_id,
+                RoundModel.status == "active",
             )
-            model = result.scalar_one_or_none()
-            if model:
-                return self._round_model_to_pydantic(model)
-            return None
+            .order_by(RoundModel.number.desc())
+            .limit(1)
+        )
+        model = result.scalar_one_or_none()
+        if model:
+            return self._round_model_to_pydantic(model)
+        return None
     
     async def get_round(self, session_code: str, round_id: str) -> Optional[Round]:
         async with get_db_session_context() as db:
@@ -337,10 +363,6 @@ class SQLStorage(Storage):
         player_id: str,
         text: str,
     ) -> Optional[Caption]:
-        # Check if already submitted
-        if await self.has_submitted(session_code, round_id, player_id):
-            return None
-        
         async with get_db_session_context() as db:
             # Get player display name
             player_result = await db.execute(
@@ -358,7 +380,12 @@ class SQLStorage(Storage):
                 submitted_at=datetime.now(timezone.utc),
             )
             db.add(caption_model)
-            await db.flush()
+            try:
+                await db.flush()
+            except IntegrityError:
+                # uq_caption_round_player: already submitted for this round
+                await db.rollback()
+                return None
             return self._caption_model_to_pydantic(caption_model, display_name)
     
     async def has_submitted(
@@ -429,30 +456,32 @@ class SQLStorage(Storage):
             session_id = await self._get_session_id_from_code(db, session_code)
             if not session_id:
                 return []
-            
-            # Get all players with their total scores
-            result = await db.execute(
-                select(
-                    PlayerModel.id,
-                    PlayerModel.display_name,
-                    func.coalesce(func.sum(CaptionModel.score_total), 0).label("total_score"),
-                )
-                .outerjoin(CaptionModel, PlayerModel.id == CaptionModel.player_id)
-                .where(PlayerModel.session_id == session_id)
-                .group_by(PlayerModel.id, PlayerModel.display_name)
-                .order_by(func.coalesce(func.sum(CaptionModel.score_total), 0).desc())
+            return await self._get_leaderboard(db, session_id)
+    
+    async def _get_leaderboard(self, db: AsyncSession, session_id: str) -> list[LeaderboardEntry]:
+        # Get all players with their total scores
+        result = await db.execute(
+            select(
+                PlayerModel.id,
+                PlayerModel.display_name,
+                func.coalesce(func.sum(CaptionModel.score_total), 0).label("total_score"),
             )
-            rows = result.all()
-            
-            return [
-                LeaderboardEntry(
-                    player_id=row.id,
-                    display_name=row.display_name,
-                    total_score=int(row.total_score),
-                    rank=i + 1,
-                )
-                for i, row in enumerate(rows)
-            ]
+            .outerjoin(CaptionModel, PlayerModel.id == CaptionModel.player_id)
+            .where(PlayerModel.session_id == session_id)
+            .group_by(PlayerModel.id, PlayerModel.display_name)
+            .order_by(func.coalesce(func.sum(CaptionModel.score_total), 0).desc())
+        )
+        rows = result.all()
+        
+        return [
+            LeaderboardEntry(
+                player_id=row.id,
+                display_name=row.display_name,
+                total_score=int(row.total_score),
+                rank=i + 1,
+            )
+            for i, row in enumerate(rows)
+        ]
     
     # ========================================================================
     # Cleanup
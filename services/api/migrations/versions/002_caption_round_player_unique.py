@@ -0,0 +1,30 @@
+"""One caption per player per round
+
+Revision ID: 002
+Revises: 001
+Create Date: 2024-01-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The constraint's index leads with round_id, so it can't serve lookups by
+    # player_id alone; ix_captions_player_id stays.
+    # batch_alter_table recreates the table on SQLite, which can't ALTER constraints.
+    with op.batch_alter_table('captions') as batch_op:
+        batch_op.create_unique_constraint('uq_caption_round_player', ['round_id', 'player_id'])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('captions') as batch_op:
+        batch_op.drop_constraint('uq_caption_round_player', type_='unique')
@@ -0,0 +1,38 @@
+"""Stamp created/joined/submitted times in the database
+
+Revision ID: 003
+Revises: 002
+Create Date: 2024-01-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column) pairs that default to the insert time
+TIMESTAMP_COLUMNS = [
+    ('sessions', 'created_at'),
+    ('players', 'joined_at'),
+    ('captions', 'submitted_at'),
+]
+
+
+def upgrade() -> None:
+    # batch_alter_table recreates the table on SQLite, which can't ALTER defaults.
+    for table, column in TIMESTAMP_COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(column, existing_type=sa.DateTime, server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(column, existing_type=sa.DateTime, server_default=None)
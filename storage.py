@@ -5,24 +5,89 @@ Handles all persistence: sessions, players, rounds, captions, and scores.
 Uses in-memory DuckDB for simplicity (can easily switch to file-based).
 """
 
+import os
 import duckdb
+import functools
 import random
 import string
+import threading
+import weakref
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
-
-
-# In-memory DuckDB connection (shared across the app)
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+
+# In-memory DuckDB connection (shared across the app). A connection runs one
+# statement at a time, so each thread gets its own cursor onto the same
+# database and reads run side by side. Writes are serialized with
+# _write_lock (see _serialized_write): two handlers can update the same
+# session row (e.g. End Session while background scoring runs), and DuckDB
+# fails the second of two overlapping updates with a conflict rather than
+# waiting. Cursors are closed when their thread exits, so there is at most
+# one per live thread (the handler and prefetch pools are bounded).
 _con: Optional[duckdb.DuckDBPyConnection] = None
+_con_lock = threading.Lock()
+_write_lock = threading.RLock()
+_thread_cursors = threading.local()
+
+# Connection settings. Game data is a few rows per session, so cap DuckDB's
+# memory (it defaults to 80% of RAM) and worker threads; both can be
+# overridden through the environment.
+DUCKDB_CONFIG = {
+    "memory_limit": os.environ.get("DUCKDB_MEMORY_LIMIT", "512MB"),
+    "threads": int(os.environ.get("DUCKDB_THREADS", str(os.cpu_count() or 1))),
+}
+
+# Session rows by session_id. All session writes go through this module and
+# invalidate their entry, so cached rows are never stale. The per-session
+# version stops a read that raced with a write from caching the old row; it
+# is also bumped by player/caption/score writes, so callers can key views
+# derived from a session's data on it (see get_session_version).
+#
+# The caches are read-copy-update: readers look up the current dict with no
+# lock, writers build a replacement under _session_cache_lock and swap the
+# module reference. Cached rows and snapshots are read-only, so they are
+# handed out without copying.
+_session_cache: dict[str, Mapping] = {}
+_session_versions: dict[str, int] = {}
+_session_cache_lock = threading.Lock()
 
 
 def get_connection() -> duckdb.DuckDBPyConnection:
-    """Get or create the database connection."""
+    """Get this thread's cursor, creating the database connection if needed."""
     global _con
-    if _con is None:
-        _con = duckdb.connect()  # In-memory database
-        _init_schema(_con)
-    return _con
+    cursor = getattr(_thread_cursors, "cursor", None)
+    if cursor is not None:
+        return cursor
+    with _con_lock:
+        if _con is None:
+            con = duckdb.connect(config=DUCKDB_CONFIG)  # In-memory database
+            _init_schema(con)
+            _con = con
+        cursor = _con.cursor()
+    # The holder dies with the thread's locals; closing on its finalizer
+    # releases the cursor when the thread exits rather than at shutdown
+    holder = _CursorHolder()
+    weakref.finalize(holder, cursor.close)
+    holder.cursor = cursor
+    _thread_cursors.holder = holder
+    _thread_cursors.cursor = cursor
+    return cursor
+
+
+class _CursorHolder:
+    """Per-thread owner of a cursor; its finalizer closes the cursor."""
+    cursor: Optional[duckdb.DuckDBPyConnection] = None
+
+
+def _serialized_write(func):
+    """Run a function that writes to the database under _write_lock."""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with _write_lock:
+            return func(*args, **kwargs)
+    return wrapper
 
 
 def _init_schema(con: duckdb.DuckDBPyConnection) -> None:
@@ -75,6 +140,18 @@ def _init_schema(con: duckdb.DuckDBPyConnection) -> None:
             PRIMARY KEY (session_id, game_number, round_number, player_id)
         )
     """)
+    
+    # Per-game running totals, maintained by update_caption_scores so the
+    # scoreboard is a keyed lookup instead of an aggregate over all captions
+    con.execute("""
+        CREATE TABLE IF NOT EXISTS game_scores (
+            session_id VARCHAR,
+            game_number INT,
+            player_id VARCHAR,
+            total_score INT,
+            PRIMARY KEY (session_id, game_number, player_id)
+        )
+    """)
 
 
 def generate_session_id() -> str:
@@ -84,6 +161,7 @@ def generate_session_id() -> str:
 
 # --- Session Management ---
 
+@_serialized_write
 def create_session(total_rounds: int = 3, round_timer: int = 45) -> str:
     """Create a new game session and return the session ID."""
     con = get_connection()
@@ -103,6 +181,8 @@ def create_session(total_rounds: int = 3, round_timer: int = 45) -> str:
 
 def session_exists(session_id: str) -> bool:
     """Check if a session exists."""
+    if session_id in _session_cache:
+        return True
     con = get_connection()
     result = con.execute(
         "SELECT 1 FROM sessions WHERE session_id = ?", [session_id]
@@ -110,8 +190,14 @@ def session_exists(session_id: str) -> bool:
     return result is not None
 
 
-def get_session(session_id: str) -> Optional[dict]:
-    """Get session details."""
+def get_session(session_id: str) -> Optional[Mapping]:
+    """Get session details as a read-only mapping (served from the session row cache when possible)."""
+    global _session_cache
+    cached = _session_cache.get(session_id)
+    if cached is not None:
+        return cached
+    
+    version = _session_versions.get(session_id, 0)
     con = get_connection()
     result = con.execute("""
         SELECT session_id, status, current_round, current_game, total_rounds, round_timer_seconds, created_at
@@ -119,7 +205,7 @@ def get_session(session_id: str) -> Optional[dict]:
     """, [session_id]).fetchone()
     
     if result:
-        return {
+        session = MappingProxyType({
             'session_id': result[0],
             'status': result[1],
             'current_round': result[2],
@@ -127,10 +213,35 @@ def get_session(session_id: str) -> Optional[dict]:
             'total_rounds': result[4],
             'round_timer_seconds': result[5],
             'created_at': result[6]
-        }
+        })
+        with _session_cache_lock:
+            if _session_versions.get(session_id, 0) == version:
+                _session_cache = {**_session_cache, session_id: session}
+        return session
     return None
 
 
+def _invalidate_session(session_id: str) -> None:
+    """Drop a session's cached row after it is modified."""
+    global _session_cache
+    with _session_cache_lock:
+        _session_versions[session_id] = _session_versions.get(session_id, 0) + 1
+        if session_id in _session_cache:
+            _session_cache = {k: v for k, v in _session_cache.items() if k != session_id}
+
+
+def _touch_session(session_id: str) -> None:
+    """Record a write to a session's players, captions or scores."""
+    with _session_cache_lock:
+        _session_versions[session_id] = _session_versions.get(session_id, 0) + 1
+
+
+def get_session_version(session_id: str) -> int:
+    """Counter that changes whenever any of the session's data is written."""
+    return _session_versions.get(session_id, 0)
+
+
+@_serialized_write
 def update_session_status(session_id: str, status: str) -> None:
     """Update session status (lobby, playing, game_over, finished)."""
     con = get_connection()
@@ -138,8 +249,10 @@ def update_session_status(session_id: str, status: str) -> None:
         "UPDATE sessions SET status = ? WHERE session_id = ?",
         [status, session_id]
     )
+    _invalidate_session(session_id)
 
 
+@_serialized_write
 def increment_round(session_id: str) -> int:
     """Increment current round and return new round number."""
     con = get_connection()
@@ -147,6 +260,7 @@ def increment_round(session_id: str) -> int:
         "UPDATE sessions SET current_round = current_round + 1 WHERE session_id = ?",
         [session_id]
     )
+    _invalidate_session(session_id)
     result = con.execute(
         "SELECT current_round FROM sessions WHERE session_id = ?",
         [session_id]
@@ -154,6 +268,7 @@ def increment_round(session_id: str) -> int:
     return result[0] if result else 0
 
 
+@_serialized_write
 def start_new_game(session_id: str) -> int:
     """Start a new game within the same session. Returns new game number."""
     con = get_connection()
@@ -162,6 +277,7 @@ def start_new_game(session_id: str) -> int:
         SET current_game = current_game + 1, current_round = 0, status = 'lobby'
         WHERE session_id = ?
     """, [session_id])
+    _invalidate_session(session_id)
     result = con.execute(
         "SELECT current_game FROM sessions WHERE session_id = ?",
         [session_id]
@@ -169,6 +285,7 @@ def start_new_game(session_id: str) -> int:
     return result[0] if result else 1
 
 
+@_serialized_write
 def reset_session(session_id: str) -> None:
     """Reset a session completely (clears all games, keeps players)."""
     con = get_connection()
@@ -178,10 +295,13 @@ def reset_session(session_id: str) -> None:
     """, [session_id])
     con.execute("DELETE FROM rounds WHERE session_id = ?", [session_id])
     con.execute("DELETE FROM captions WHERE session_id = ?", [session_id])
+    con.execute("DELETE FROM game_scores WHERE session_id = ?", [session_id])
+    _invalidate_session(session_id)
 
 
 # --- Player Management ---
 
+@_serialized_write
 def add_player(session_id: str, player_name: str, is_host: bool = False) -> str:
     """Add a player to a session and return their player_id."""
     con = get_connection()
@@ -191,6 +311,7 @@ def add_player(session_id: str, player_name: str, is_host: bool = False) -> str:
         INSERT INTO players (session_id, player_id, name, is_host)
         VALUES (?, ?, ?, ?)
     """, [session_id, player_id, player_name.strip() or "Anonymous", is_host])
+    _touch_session(session_id)
     
     return player_id
 
@@ -210,6 +331,51 @@ def get_players(session_id: str) -> list[dict]:
     ]
 
 
+@dataclass(frozen=True)
+class SessionSnapshot:
+    """A session's row and players, read together for rendering a view."""
+    session_id: str
+    status: str
+    current_round: int
+    current_game: int
+    total_rounds: int
+    players: tuple[dict, ...]
+
+
+# session_id -> (session version it was built at, snapshot); read-copy-update like _session_cache
+_snapshot_cache: dict[str, tuple[int, SessionSnapshot]] = {}
+
+
+def snapshot(session_id: str) -> Optional[SessionSnapshot]:
+    """Read everything a session view needs in one call. None if the session doesn't exist.
+    
+    Snapshots are cached until the session's version changes, so repeated
+    reads of an unchanged session are a lock-free dict lookup.
+    """
+    global _snapshot_cache
+    version = get_session_version(session_id)
+    cached = _snapshot_cache.get(session_id)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    
+    session = get_session(session_id)
+    if not session:
+        return None
+    snap = SessionSnapshot(
+        session_id=session_id,
+        status=session['status'],
+        current_round=session['current_round'],
+        current_game=session['current_game'],
+        total_rounds=session['total_rounds'],
+        players=tuple(get_players(session_id)),
+    )
+    
+    with _session_cache_lock:
+        if _session_versions.get(session_id, 0) == version:
+            _snapshot_cache = {**_snapshot_cache, session_id: (version, snap)}
+    return snap
+
+
 def get_player_name(session_id: str, player_id: str) -> Optional[str]:
     """Get a player's name."""
     con = get_connection()
@@ -234,6 +400,7 @@ def get_host_player(session_id: str) -> Optional[dict]:
 
 # --- Round Management ---
 
+@_serialized_write
 def start_round(session_id: str, game_number: int, round_number: int, image_url: str) -> None:
     """Record the start of a new round."""
     con = get_connection()
@@ -243,6 +410,7 @@ def start_round(session_id: str, game_number: int, round_number: int, image_url:
     """, [session_id, game_number, round_number, image_url, datetime.now()])
 
 
+@_serialized_write
 def end_round(session_id: str, game_number: int, round_number: int) -> None:
     """Mark a round as ended."""
     con = get_connection()
@@ -264,6 +432,7 @@ def get_round_image(session_id: str, game_number: int, round_number: int) -> Opt
 
 # --- Caption Management ---
 
+@_serialized_write
 def submit_caption(
     session_id: str,
     game_number: int,
@@ -292,6 +461,7 @@ def submit_caption(
         INSERT INTO captions (session_id, game_number, round_number, player_id, caption)
         VALUES (?, ?, ?, ?, ?)
     """, [session_id, game_number, round_number, player_id, caption.strip()])
+    _touch_session(session_id)
     
     return True
 
@@ -306,6 +476,19 @@ def has_submitted(session_id: str, game_number: int, round_number: int, player_i
     return result is not None
 
 
+def all_players_submitted(session_id: str, game_number: int, round_number: int) -> bool:
+    """Check if every player in the session has submitted a caption this round."""
+    con = get_connection()
+    result = con.execute("""
+        SELECT
+            (SELECT COUNT(*) FROM players WHERE session_id = ?) AS total_players,
+            (SELECT COUNT(*) FROM captions
+             WHERE session_id = ? AND game_number = ? AND round_number = ?) AS submitted
+    """, [session_id, session_id, game_number, round_number]).fetchone()
+    total_players, submitted = result
+    return total_players > 0 and submitted >= total_players
+
+
 def get_round_captions(session_id: str, game_number: int, round_number: int) -> list[dict]:
     """Get all captions for a round with player names."""
     con = get_connection()
@@ -329,6 +512,7 @@ def get_round_captions(session_id: str, game_number: int, round_number: int) ->
     ]
 
 
+@_serialized_write
 def update_caption_scores(
     session_id: str,
     game_number: int,
@@ -341,26 +525,44 @@ def update_caption_scores(
     """
     con = get_connection()
     
+    # Resolve names once (first player wins on duplicate names) and read the
+    # round's current scores so re-scoring adjusts totals rather than adding
+    player_ids: dict[str, str] = {}
+    for name, player_id in con.execute(
+        "SELECT name, player_id FROM players WHERE session_id = ? ORDER BY joined_at",
+        [session_id]
+    ).fetchall():
+        player_ids.setdefault(name, player_id)
+    old_scores = dict(con.execute("""
+        SELECT player_id, score FROM captions
+        WHERE session_id = ? AND game_number = ? AND round_number = ?
+    """, [session_id, game_number, round_number]).fetchall())
+    
+    new_scores: dict[str, tuple[int, str]] = {}
     for score_data in scores:
-        # Find player_id by name
-        player = con.execute("""
-            SELECT player_id FROM players
-            WHERE session_id = ? AND name = ?
-        """, [session_id, score_data.get('player_name', '')]).fetchone()
-        
-        if player:
-            con.execute("""
-                UPDATE captions
-                SET score = ?, roast_comment = ?
-                WHERE session_id = ? AND game_number = ? AND round_number = ? AND player_id = ?
-            """, [
-                score_data.get('score', 0),
-                score_data.get('roast_comment', ''),
-                session_id,
-                game_number,
-                round_number,
-                player[0]
-            ])
+        player_id = player_ids.get(score_data.get('player_name', ''))
+        if player_id in old_scores:
+            new_scores[player_id] = (score_data.get('score', 0), score_data.get('roast_comment', ''))
+    if not new_scores:
+        return
+    
+    con.executemany("""
+        UPDATE captions
+        SET score = ?, roast_comment = ?
+        WHERE session_id = ? AND game_number = ? AND round_number = ? AND player_id = ?
+    """, [
+        [score, roast_comment, session_id, game_number, round_number, player_id]
+        for player_id, (score, roast_comment) in new_scores.items()
+    ])
+    con.executemany("""
+        INSERT INTO game_scores VALUES (?, ?, ?, ?)
+        ON CONFLICT (session_id, game_number, player_id)
+        DO UPDATE SET total_score = game_scores.total_score + excluded.total_score
+    """, [
+        [session_id, game_number, player_id, score - (old_scores[player_id] or 0)]
+        for player_id, (score, _) in new_scores.items()
+    ])
+    _touch_session(session_id)
 
 
 # --- Scoreboard ---
@@ -369,13 +571,12 @@ def get_game_scoreboard(session_id: str, game_number: int) -> list[dict]:
     """Get the scoreboard for a specific game (total points per player in that game)."""
     con = get_connection()
     results = con.execute("""
-        SELECT p.name, COALESCE(SUM(c.score), 0) as total_score
+        SELECT p.name, COALESCE(g.total_score, 0) as total_score
         FROM players p
-        LEFT JOIN captions c ON p.session_id = c.session_id 
-            AND p.player_id = c.player_id 
-            AND c.game_number = ?
+        LEFT JOIN game_scores g ON p.session_id = g.session_id
+            AND p.player_id = g.player_id
+            AND g.game_number = ?
         WHERE p.session_id = ?
-        GROUP BY p.player_id, p.name
         ORDER BY total_score DESC
     """, [game_number, session_id]).fetchall()
     
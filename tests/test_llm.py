@@ -0,0 +1,58 @@
+"""Tests for llm.py scoring (run in fake mode, no API keys needed)."""
+
+import asyncio
+import os
+import unittest
+from unittest import mock
+
+import llm
+
+
+CAPTIONS = [
+    {'player_name': 'Alice', 'caption': 'hello there kitty'},
+    {'player_name': 'Bob', 'caption': 'I can haz cheezburger'},
+]
+
+
+@mock.patch.dict(os.environ, {"FAKE_LLM_MODE": "true"})
+class ScoreWithoutImageTest(unittest.TestCase):
+    """The round image is gone after its session state is released or rebuilt."""
+    
+    def test_score_captions_without_image(self):
+        results = llm.score_captions(None, CAPTIONS)
+        self.assertEqual([r['player_name'] for r in results], ['Alice', 'Bob'])
+        self.assertTrue(all(0 <= r['score'] <= 10 for r in results))
+    
+    def test_score_captions_async_without_image(self):
+        results = asyncio.run(llm.score_captions_async(None, CAPTIONS))
+        self.assertEqual([r['player_name'] for r in results], ['Alice', 'Bob'])
+    
+    def test_no_image_skips_score_cache(self):
+        self.assertIsNone(llm._image_cache_key(None, None))
+        self.assertIsNone(llm._image_cache_key(None, "https://cdn2.thecatapi.com/images/a.jpg"))
+
+
+
+class GeminiStreamTest(unittest.TestCase):
+    """_gemini_request stops reading once every caption is scored."""
+    
+    def test_stream_cancelled_after_early_return(self):
+        chunks = [
+            '{"results": [{"player_name": "Alice", "caption": "hello there kitty", "score": 7}, ',
+            '{"player_name": "Bob", "caption": "I can haz cheezburger", "score": 8}',
+            ', "trailing output the parser never needs"',
+        ]
+        stream = mock.MagicMock()
+        stream.__iter__.return_value = iter([mock.Mock(text=c) for c in chunks])
+        model = mock.Mock()
+        model.generate_content.return_value = stream
+        with mock.patch.object(llm, "_gemini_model", model), \
+                mock.patch.object(llm, "genai", mock.Mock()), \
+                mock.patch.object(llm, "_get_gemini_retry", mock.Mock()):
+            results = llm._gemini_request(None, CAPTIONS)
+        self.assertEqual([r['score'] for r in results], [7, 8])
+        stream._iterator.cancel.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()